@@ -0,0 +1,28 @@
+"""
+Shared helper for the example scripts: build a web3 provider from RPC_URL
+"""
+
+
+def make_provider(provider_url: str):
+    """
+    Build a web3 provider for an RPC URL
+
+    ws:// and wss:// URLs keep one socket open for every call (web3 v6-v7 only;
+    v8 dropped the synchronous WebSocket provider). Paths ending in .ipc use the
+    node's IPC socket, e.g. Hardhat 2.22+. Anything else is treated as HTTP.
+    """
+    # Imported here so scripts that only touch IPFS do not pay for loading web3
+    from web3 import Web3
+
+    if provider_url.startswith(("ws://", "wss://")):
+        ws_provider = getattr(Web3, "LegacyWebSocketProvider", None) or getattr(
+            Web3, "WebsocketProvider", None
+        )
+        if ws_provider is None:
+            raise ValueError(
+                "This web3 version has no synchronous WebSocket provider; use HTTP or IPC"
+            )
+        return ws_provider(provider_url)
+    if provider_url.endswith(".ipc"):
+        return Web3.IPCProvider(provider_url)
+    return Web3.HTTPProvider(provider_url)
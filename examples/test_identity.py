@@ -10,8 +10,12 @@ This example demonstrates:
 - Registering agents
 - Reading agent information
 - Updating tokenURI
+- Running independent tests concurrently from one signer
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
 from erc8004 import ERC8004Client, Web3Adapter
 from web3 import Web3
 
@@ -21,67 +25,47 @@ REPUTATION_REGISTRY = "0x8004B312333aCb5764597c2BeEe256596B5C6876"
 VALIDATION_REGISTRY = "0x8004C8AEF64521bC97AB50799d394CDb785885E3"
 
 
-def main():
-    print("🚀 ERC-8004 SDK Test\n")
-
-    # Connect to local Hardhat
-    print("Connecting to local Hardhat...")
-    w3 = Web3(Web3.HTTPProvider("http://127.0.0.1:8545"))
-
-    # Use first hardhat account (hardhat default private key)
-    private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
-
-    # Create adapter
-    adapter = Web3Adapter(w3, private_key=private_key)
-
-    # Initialize SDK with adapter
-    client = ERC8004Client(
-        adapter=adapter,
-        addresses={
-            "identityRegistry": IDENTITY_REGISTRY,
-            "reputationRegistry": REPUTATION_REGISTRY,
-            "validationRegistry": VALIDATION_REGISTRY,
-            "chainId": 31337,  # Hardhat chain ID
-        },
-    )
-
-    signer_address = client.get_address()
-    print(f"Connected with signer: {signer_address}\n")
-
-    # Test 1: Register agent with no URI, then set URI
-    print("Test 1: Register agent with no URI, then set URI")
+def run_register_then_set_uri(client: ERC8004Client) -> List[str]:
+    """Test 1: Register agent with no URI, then set URI"""
+    out = ["Test 1: Register agent with no URI, then set URI"]
     try:
         result1 = client.identity.register()
-        print(f"✅ Registered agent ID: {result1['agentId']}")
-        print(f"   TX Hash: {result1['txHash']}")
-        print(f"   Owner: {client.identity.get_owner(result1['agentId'])}")
+        out.append(f"✅ Registered agent ID: {result1['agentId']}")
+        out.append(f"   TX Hash: {result1['txHash']}")
+        out.append(f"   Owner: {client.identity.get_owner(result1['agentId'])}")
 
         # Set the tokenURI after registration
         new_uri = "ipfs://QmNewAgent456"
         client.identity.set_agent_uri(result1["agentId"], new_uri)
-        print(f"✅ Set tokenURI to: {new_uri}")
+        out.append(f"✅ Set tokenURI to: {new_uri}")
 
         # Verify it was set
         retrieved_uri = client.identity.get_token_uri(result1["agentId"])
-        print(f"   Retrieved URI: {retrieved_uri}\n")
+        out.append(f"   Retrieved URI: {retrieved_uri}")
     except Exception as error:
-        print(f"❌ Error: {error}\n")
+        out.append(f"❌ Error: {error}")
+    return out
+
 
-    # Test 2: Register agent with URI
-    print("Test 2: Register agent with URI")
+def run_register_with_uri(client: ERC8004Client) -> List[str]:
+    """Test 2: Register agent with URI"""
+    out = ["Test 2: Register agent with URI"]
     try:
         # Example registration file (in production, this would be hosted)
         registration_uri = "https://example.com/agent1.json"
         result2 = client.identity.register_with_uri(registration_uri)
-        print(f"✅ Registered agent ID: {result2['agentId']}")
-        print(f"   TX Hash: {result2['txHash']}")
-        print(f"   Owner: {client.identity.get_owner(result2['agentId'])}")
-        print(f"   URI: {client.identity.get_token_uri(result2['agentId'])}\n")
+        out.append(f"✅ Registered agent ID: {result2['agentId']}")
+        out.append(f"   TX Hash: {result2['txHash']}")
+        out.append(f"   Owner: {client.identity.get_owner(result2['agentId'])}")
+        out.append(f"   URI: {client.identity.get_token_uri(result2['agentId'])}")
     except Exception as error:
-        print(f"❌ Error: {error}\n")
+        out.append(f"❌ Error: {error}")
+    return out
+
 
-    # Test 3: Register agent with URI and metadata
-    print("Test 3: Register agent with URI and on-chain metadata")
+def run_register_with_metadata(client: ERC8004Client) -> List[str]:
+    """Test 3: Register agent with URI and on-chain metadata"""
+    out = ["Test 3: Register agent with URI and on-chain metadata"]
     try:
         registration_uri = "ipfs://QmExample123"
         metadata = [
@@ -90,30 +74,76 @@ def main():
         ]
 
         result3 = client.identity.register_with_metadata(registration_uri, metadata)
-        print(f"✅ Registered agent ID: {result3['agentId']}")
-        print(f"   TX Hash: {result3['txHash']}")
-        print(f"   Owner: {client.identity.get_owner(result3['agentId'])}")
-        print(f"   URI: {client.identity.get_token_uri(result3['agentId'])}")
-
-        # Read back metadata
-        agent_name = client.identity.get_metadata(result3["agentId"], "agentName")
-        agent_wallet = client.identity.get_metadata(result3["agentId"], "agentWallet")
-        print(f"   Metadata - agentName: {agent_name}")
-        print(f"   Metadata - agentWallet: {agent_wallet}\n")
+        out.append(f"✅ Registered agent ID: {result3['agentId']}")
+        out.append(f"   TX Hash: {result3['txHash']}")
+
+        # Read back owner, URI and metadata in a single batched request
+        info = client.identity.get_agent_info(result3["agentId"], ["agentName", "agentWallet"])
+        out.append(f"   Owner: {info['owner']}")
+        out.append(f"   URI: {info['tokenURI']}")
+        out.append(f"   Metadata - agentName: {info['metadata']['agentName']}")
+        out.append(f"   Metadata - agentWallet: {info['metadata']['agentWallet']}")
     except Exception as error:
-        print(f"❌ Error: {error}\n")
+        out.append(f"❌ Error: {error}")
+    return out
 
-    # Test 4: Set metadata after registration
-    print("Test 4: Set metadata after registration")
+
+def run_set_metadata(client: ERC8004Client) -> List[str]:
+    """Test 4: Set metadata after registration"""
+    out = ["Test 4: Set metadata after registration"]
     try:
         result4 = client.identity.register()
-        print(f"✅ Registered agent ID: {result4['agentId']}")
+        out.append(f"✅ Registered agent ID: {result4['agentId']}")
 
         client.identity.set_metadata(result4["agentId"], "status", "active")
         status = client.identity.get_metadata(result4["agentId"], "status")
-        print(f"   Set metadata - status: {status}\n")
+        out.append(f"   Set metadata - status: {status}")
     except Exception as error:
-        print(f"❌ Error: {error}\n")
+        out.append(f"❌ Error: {error}")
+    return out
+
+
+def main():
+    print("🚀 ERC-8004 SDK Test\n")
+
+    # Connect to local Hardhat
+    print("Connecting to local Hardhat...")
+    w3 = Web3(Web3.HTTPProvider("http://127.0.0.1:8545"))
+
+    # Use first hardhat account (hardhat default private key)
+    private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+
+    # Create adapter
+    adapter = Web3Adapter(w3, private_key=private_key)
+
+    # Initialize SDK with adapter
+    client = ERC8004Client(
+        adapter=adapter,
+        addresses={
+            "identityRegistry": IDENTITY_REGISTRY,
+            "reputationRegistry": REPUTATION_REGISTRY,
+            "validationRegistry": VALIDATION_REGISTRY,
+            "chainId": 31337,  # Hardhat chain ID
+        },
+    )
+
+    signer_address = client.get_address()
+    print(f"Connected with signer: {signer_address}\n")
+
+    # The four tests are independent, so run them concurrently. The adapter
+    # serializes nonce assignment, and each test collects its output so the
+    # report still prints in order.
+    tests = [
+        run_register_then_set_uri,
+        run_register_with_uri,
+        run_register_with_metadata,
+        run_set_metadata,
+    ]
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        reports = list(executor.map(lambda test: test(client), tests))
+
+    for report in reports:
+        print("\n".join(report) + "\n")
 
     print("✨ All tests completed!")
 
@@ -12,11 +12,14 @@ This example demonstrates:
 - Reading feedback and reputation summaries
 """
 
+import os
 import time
 
 from erc8004 import ERC8004Client, Web3Adapter
 from web3 import Web3
 
+from providers import make_provider
+
 # Contract addresses - CREATE2 vanity addresses (same on all networks)
 IDENTITY_REGISTRY = "0x8004AbdDA9b877187bF865eD1d8B5A41Da3c4997"
 REPUTATION_REGISTRY = "0x8004B312333aCb5764597c2BeEe256596B5C6876"
@@ -26,9 +29,10 @@ VALIDATION_REGISTRY = "0x8004C8AEF64521bC97AB50799d394CDb785885E3"
 def main():
     print("🚀 ERC-8004 Reputation/Feedback Test\n")
 
-    # Connect to local Hardhat
-    print("Connecting to local Hardhat...")
-    w3 = Web3(Web3.HTTPProvider("http://127.0.0.1:8545"))
+    # Connect to local Hardhat (RPC_URL may be ws://, wss:// or an .ipc path)
+    provider_url = os.getenv("RPC_URL", "http://127.0.0.1:8545")
+    print(f"Connecting to {provider_url}...")
+    w3 = Web3(make_provider(provider_url))
 
     # Use first account as agent owner (hardhat account 0)
     agent_owner_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
@@ -36,7 +40,8 @@ def main():
     client_key = "0x59c6995e998f97a5a0044966f0945389dc9e86dae88c7a8412f4603b6b78690d"
 
     agent_adapter = Web3Adapter(w3, private_key=agent_owner_key)
-    client_adapter = Web3Adapter(w3, private_key=client_key)
+    # Same connection and contract cache, different signer
+    client_adapter = agent_adapter.with_signer(private_key=client_key)
 
     agent_owner_address = agent_adapter.get_address()
     client_address = client_adapter.get_address()
@@ -44,26 +49,23 @@ def main():
     print(f"Agent Owner: {agent_owner_address}")
     print(f"Client: {client_address}\n")
 
+    addresses = {
+        "identityRegistry": IDENTITY_REGISTRY,
+        "reputationRegistry": REPUTATION_REGISTRY,
+        "validationRegistry": VALIDATION_REGISTRY,
+        "chainId": 31337,
+    }
+
     # Create SDK instance for agent owner
     agent_sdk = ERC8004Client(
         adapter=agent_adapter,
-        addresses={
-            "identityRegistry": IDENTITY_REGISTRY,
-            "reputationRegistry": REPUTATION_REGISTRY,
-            "validationRegistry": VALIDATION_REGISTRY,
-            "chainId": 31337,
-        },
+        addresses=addresses,
     )
 
     # Create SDK instance for client
     client_sdk = ERC8004Client(
         adapter=client_adapter,
-        addresses={
-            "identityRegistry": IDENTITY_REGISTRY,
-            "reputationRegistry": REPUTATION_REGISTRY,
-            "validationRegistry": VALIDATION_REGISTRY,
-            "chainId": 31337,
-        },
+        addresses=addresses,
     )
 
     # Step 1: Register an agent
@@ -86,49 +88,68 @@ def main():
     print("   Tags: excellent, fast")
     print(f"   TX Hash: {feedback_result['txHash']}\n")
 
+    # Steps 3-5 are independent reads, so fetch them in one batched request
+    overview = client_sdk.reputation.get_feedback_overview(agent_id, client_address, 1)
+
+    # Steps 3-5 only format data already fetched; report them in one write
+    lines = []
+
     # Step 3: Read the feedback back
-    print("\n📋 Step 3: Reading feedback...")
-    feedback = client_sdk.reputation.read_feedback(agent_id, client_address, 1)
-    print("✅ Feedback retrieved:")
-    print(f"   Score: {feedback['score']} / 100")
-    print(f"   Tag1: {feedback['tag1']}")
-    print(f"   Tag2: {feedback['tag2']}")
-    print(f"   Revoked: {feedback['isRevoked']}\n")
+    lines.append("\n📋 Step 3: Reading feedback...")
+    feedback = overview["feedback"]
+    lines.append("✅ Feedback retrieved:")
+    lines.append(f"   Score: {feedback['score']} / 100")
+    lines.append(f"   Tag1: {feedback['tag1']}")
+    lines.append(f"   Tag2: {feedback['tag2']}")
+    lines.append(f"   Revoked: {feedback['isRevoked']}\n")
 
     # Step 4: Get reputation summary
-    print("📋 Step 4: Getting reputation summary...")
-    summary = client_sdk.reputation.get_summary(agent_id, [client_address])
-    print("✅ Reputation summary:")
-    print(f"   Feedback Count: {summary['count']}")
-    print(f"   Average Score: {summary['averageScore']} / 100\n")
+    lines.append("📋 Step 4: Getting reputation summary...")
+    summary = overview["summary"]
+    lines.append("✅ Reputation summary:")
+    lines.append(f"   Feedback Count: {summary['count']}")
+    lines.append(f"   Average Score: {summary['averageScore']} / 100\n")
 
     # Step 5: Get all clients who gave feedback
-    print("📋 Step 5: Getting all clients...")
-    clients = client_sdk.reputation.get_clients(agent_id)
-    print(f"✅ Clients who gave feedback: {len(clients)}")
-    print(f"   {', '.join(clients)}\n")
+    lines.append("📋 Step 5: Getting all clients...")
+    clients = overview["clients"]
+    lines.append(f"✅ Clients who gave feedback: {len(clients)}")
+    lines.append(f"   {', '.join(clients)}\n")
+    print("\n".join(lines))
 
     # Step 6: Submit another feedback with higher score
     print("📋 Step 6: Submitting second feedback...")
-    client_sdk.reputation.give_feedback(
-        agent_id=agent_id, score=98
-    )
+    # Broadcast only; the signer's nonce is tracked locally, so further
+    # feedbacks could be sent here before waiting on any of them
+    second_feedback = client_sdk.reputation.give_feedback(agent_id=agent_id, score=98, wait=False)
+    client_adapter.wait_for_transaction(second_feedback["txHash"])
     print("✅ Second feedback submitted (score: 98)\n")
 
+    # Steps 7-8 are read together as well
+    overview = client_sdk.reputation.get_feedback_overview(agent_id)
+
+    # Report steps 7-8 in one write
+    lines = []
+
     # Step 7: Get updated summary
-    print("📋 Step 7: Getting updated reputation summary...")
-    updated_summary = client_sdk.reputation.get_summary(agent_id)
-    print("✅ Updated reputation summary:")
-    print(f"   Feedback Count: {updated_summary['count']}")
-    print(f"   Average Score: {updated_summary['averageScore']} / 100\n")
+    lines.append("📋 Step 7: Getting updated reputation summary...")
+    updated_summary = overview["summary"]
+    lines.append("✅ Updated reputation summary:")
+    lines.append(f"   Feedback Count: {updated_summary['count']}")
+    lines.append(f"   Average Score: {updated_summary['averageScore']} / 100\n")
 
     # Step 8: Read all feedback
-    print("\n📋 Step 8: Reading all feedback...")
-    all_feedback = client_sdk.reputation.read_all_feedback(agent_id)
-    print("✅ All feedback retrieved:")
-    print(f"   Total: {len(all_feedback['scores'])} feedback entries")
-    for i, score in enumerate(all_feedback["scores"]):
-        print(f"   [{i}] Client: {all_feedback['clientAddresses'][i][:10]}... Score: {score}")
+    lines.append("\n📋 Step 8: Reading all feedback...")
+    all_feedback = overview["allFeedback"]
+    lines.append("✅ All feedback retrieved:")
+    lines.append(f"   Total: {len(all_feedback['scores'])} feedback entries")
+    lines.extend(
+        f"   [{i}] Client: {address[:10]}... Score: {score}"
+        for i, (address, score) in enumerate(
+            zip(all_feedback["clientAddresses"], all_feedback["scores"])
+        )
+    )
+    print("\n".join(lines))
 
     # Step 9: Revoke the first feedback
     print("\n📋 Step 9: Revoking first feedback...")
@@ -136,19 +157,26 @@ def main():
     print("✅ Feedback revoked!")
     print(f"   TX Hash: {revoke_result['txHash']}\n")
 
+    # Steps 10-11 are read together as well
+    overview = client_sdk.reputation.get_feedback_overview(agent_id, client_address, 1)
+
+    # Report steps 10-11 in one write
+    lines = []
+
     # Step 10: Verify feedback is revoked
-    print("📋 Step 10: Verifying revoked feedback...")
-    revoked_feedback = client_sdk.reputation.read_feedback(agent_id, client_address, 1)
-    print("✅ Revoked feedback status:")
-    print(f"   Score: {revoked_feedback['score']} / 100")
-    print(f"   Revoked: {revoked_feedback['isRevoked']}\n")
+    lines.append("📋 Step 10: Verifying revoked feedback...")
+    revoked_feedback = overview["feedback"]
+    lines.append("✅ Revoked feedback status:")
+    lines.append(f"   Score: {revoked_feedback['score']} / 100")
+    lines.append(f"   Revoked: {revoked_feedback['isRevoked']}\n")
 
     # Step 11: Get summary after revoke (should exclude revoked feedback)
-    print("📋 Step 11: Getting summary after revoke...")
-    final_summary = client_sdk.reputation.get_summary(agent_id)
-    print("✅ Final reputation summary (excluding revoked):")
-    print(f"   Feedback Count: {final_summary['count']}")
-    print(f"   Average Score: {final_summary['averageScore']} / 100\n")
+    lines.append("📋 Step 11: Getting summary after revoke...")
+    final_summary = overview["summary"]
+    lines.append("✅ Final reputation summary (excluding revoked):")
+    lines.append(f"   Feedback Count: {final_summary['count']}")
+    lines.append(f"   Average Score: {final_summary['averageScore']} / 100\n")
+    print("\n".join(lines))
 
     print("🎉 All tests completed successfully!")
 
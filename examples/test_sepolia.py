@@ -20,7 +20,11 @@ This example demonstrates:
 import os
 import secrets
 import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from erc8004 import ERC8004Client, Web3Adapter, ipfs_uri_to_bytes32
+from erc8004.utils.ipfs import base58_encode
 from web3 import Web3
 from dotenv import load_dotenv
 
@@ -32,8 +36,12 @@ IDENTITY_REGISTRY = "0x8004AbdDA9b877187bF865eD1d8B5A41Da3c4997"
 REPUTATION_REGISTRY = "0x8004B312333aCb5764597c2BeEe256596B5C6876"
 VALIDATION_REGISTRY = "0x8004C8AEF64521bC97AB50799d394CDb785885E3"
 
-# Base58 alphabet for CIDv0 encoding
-BASE58_ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+ETHERSCAN_TX_URL = "https://sepolia.etherscan.io/tx/"
+
+
+def etherscan_url(tx_hash: str) -> str:
+    """Get the Sepolia Etherscan link for a transaction hash"""
+    return ETHERSCAN_TX_URL + tx_hash
 
 
 def generate_random_cidv0() -> str:
@@ -49,22 +57,7 @@ def generate_random_cidv0() -> str:
     cid_bytes.extend(random_bytes)
 
     # Encode to base58
-    num = int.from_bytes(cid_bytes, 'big')
-
-    encoded = ''
-    while num > 0:
-        remainder = num % 58
-        encoded = BASE58_ALPHABET[remainder] + encoded
-        num = num // 58
-
-    # Handle leading zeros
-    for byte in cid_bytes:
-        if byte == 0:
-            encoded = '1' + encoded
-        else:
-            break
-
-    return encoded
+    return base58_encode(bytes(cid_bytes))
 
 
 def main():
@@ -77,7 +70,20 @@ def main():
         print("❌ Error: SEPOLIA_RPC_URL not set in .env file")
         return
 
-    w3 = Web3(Web3.HTTPProvider(sepolia_rpc))
+    # Both adapters share this provider; give it one pooled keep-alive session so
+    # every RPC after the first reuses an open TLS connection
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        ),
+    )
+    w3 = Web3(
+        Web3.HTTPProvider(sepolia_rpc, session=session, request_kwargs={"timeout": 30})
+    )
 
     if not w3.is_connected():
         print("❌ Error: Failed to connect to Sepolia")
@@ -136,28 +142,17 @@ def main():
         agent_id = result['agentId']
         print(f"✅ Registered agent ID: {agent_id}")
         print(f"   TX Hash: {result['txHash']}")
-        print(f"   🔍 View on Etherscan: https://sepolia.etherscan.io/tx/{result['txHash']}")
-
-        try:
-            owner = client.identity.get_owner(agent_id)
-            print(f"   Owner: {owner}")
-        except Exception as e:
-            print(f"   ⚠️  get_owner failed: {e}")
-
-        try:
-            uri = client.identity.get_token_uri(agent_id)
-            print(f"   URI: {uri}")
-        except Exception as e:
-            print(f"   ⚠️  get_token_uri failed: {e}")
+        print("   🔍 View on Etherscan:", etherscan_url(result['txHash']))
 
-        # Read back metadata
+        # Read back owner, URI and metadata in a single batched request
         try:
-            agent_name = client.identity.get_metadata(agent_id, "agentName")
-            agent_wallet = client.identity.get_metadata(agent_id, "agentWallet")
-            print(f"   Metadata - agentName: {agent_name}")
-            print(f"   Metadata - agentWallet: {agent_wallet}\n")
+            info = client.identity.get_agent_info(agent_id, ["agentName", "agentWallet"])
+            print(f"   Owner: {info['owner']}")
+            print(f"   URI: {info['tokenURI']}")
+            print(f"   Metadata - agentName: {info['metadata']['agentName']}")
+            print(f"   Metadata - agentWallet: {info['metadata']['agentWallet']}\n")
         except Exception as e:
-            print(f"   ⚠️  get_metadata failed: {e}\n")
+            print(f"   ⚠️  get_agent_info failed: {e}\n")
     except Exception as error:
         print(f"❌ Error during registration: {error}")
         import traceback
@@ -171,7 +166,7 @@ def main():
         status = client.identity.get_metadata(agent_id, "status")
         print(f"   Set metadata - status: {status}")
         print(f"   TX Hash: {set_metadata_result['txHash']}")
-        print(f"   🔍 View on Etherscan: https://sepolia.etherscan.io/tx/{set_metadata_result['txHash']}\n")
+        print("   🔍 View on Etherscan:", etherscan_url(set_metadata_result['txHash']), end="\n\n")
     except Exception as error:
         print(f"❌ Error: {error}\n")
 
@@ -189,7 +184,7 @@ def main():
         print(f"   Score: 95 / 100")
         print(f"   Tags: excellent, reliable")
         print(f"   TX Hash: {feedback_result['txHash']}")
-        print(f"   🔍 View on Etherscan: https://sepolia.etherscan.io/tx/{feedback_result['txHash']}")
+        print("   🔍 View on Etherscan:", etherscan_url(feedback_result['txHash']))
 
         # Read the feedback back (first feedback is at index 1)
         feedback = feedback_client.reputation.read_feedback(
@@ -233,7 +228,7 @@ def main():
         print(f"   Request URI: {request_uri}")
         print(f"   Request Hash: {request_result['requestHash']}")
         print(f"   TX Hash: {request_result['txHash']}")
-        print(f"   🔍 View on Etherscan: https://sepolia.etherscan.io/tx/{request_result['txHash']}")
+        print("   🔍 View on Etherscan:", etherscan_url(request_result['txHash']))
 
         # Wait for 1 block confirmation before submitting validation response
         print(f"⏳ Waiting for 1 block confirmation...")
@@ -258,7 +253,7 @@ def main():
         print(f"   Tag: zkML-proof")
         print(f"   Response URI: {response_uri}")
         print(f"   TX Hash: {response_result['txHash']}")
-        print(f"   🔍 View on Etherscan: https://sepolia.etherscan.io/tx/{response_result['txHash']}")
+        print("   🔍 View on Etherscan:", etherscan_url(response_result['txHash']))
 
         # Read validation status
         status = client.validation.get_validation_status(request_hash)
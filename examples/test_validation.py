@@ -11,8 +11,10 @@ This example demonstrates:
 - Reading validation status
 """
 
-import secrets
+import os
+from typing import List
 from erc8004 import ERC8004Client, Web3Adapter, ipfs_uri_to_bytes32
+from erc8004.utils.ipfs import base58_encode
 from web3 import Web3
 
 # Contract addresses - CREATE2 vanity addresses (same on all networks)
@@ -20,39 +22,25 @@ IDENTITY_REGISTRY = "0x8004AbdDA9b877187bF865eD1d8B5A41Da3c4997"
 REPUTATION_REGISTRY = "0x8004B312333aCb5764597c2BeEe256596B5C6876"
 VALIDATION_REGISTRY = "0x8004C8AEF64521bC97AB50799d394CDb785885E3"
 
-# Base58 alphabet for CIDv0 encoding
-BASE58_ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
-
 
 def generate_random_cidv0() -> str:
     """
     Generate a random CIDv0 (Qm...) for testing purposes
     CIDv0 format: base58(0x12 + 0x20 + 32 random bytes)
     """
-    # Create random 32 bytes
-    random_bytes = secrets.token_bytes(32)
-
-    # Build CIDv0 structure: [0x12 (sha256), 0x20 (32 bytes), ...random bytes...]
-    cid_bytes = bytearray([0x12, 0x20])
-    cid_bytes.extend(random_bytes)
+    return random_cidv0_batch(1)[0]
 
-    # Encode to base58
-    num = int.from_bytes(cid_bytes, 'big')
 
-    encoded = ''
-    while num > 0:
-        remainder = num % 58
-        encoded = BASE58_ALPHABET[remainder] + encoded
-        num = num // 58
-
-    # Handle leading zeros
-    for byte in cid_bytes:
-        if byte == 0:
-            encoded = '1' + encoded
-        else:
-            break
+def random_cidv0_batch(n: int) -> List[str]:
+    """
+    Generate n random CIDv0s from a single read of the OS random source
+    os.urandom is the same source secrets.token_bytes uses; slicing one buffer
+    avoids a getrandom() syscall per CID when generating many of them
+    """
+    pool = os.urandom(32 * n)
 
-    return encoded
+    # Build each CIDv0 structure: [0x12 (sha256), 0x20 (32 bytes), ...random bytes...]
+    return [base58_encode(b"\x12\x20" + pool[i * 32 : (i + 1) * 32]) for i in range(n)]
 
 
 def main():
@@ -135,9 +123,14 @@ def main():
     print(f"   Tag: zkML-proof")
     print(f"   TX Hash: {response_result['txHash']}\n")
 
+    # Steps 4-7 are independent reads, so fetch them in one batched request
+    overview = agent_sdk.validation.get_validation_overview(
+        agent_id, validator_address, request_hash
+    )
+
     # Step 4: Read validation status
     print("📋 Step 4: Reading validation status...")
-    status = agent_sdk.validation.get_validation_status(request_hash)
+    status = overview["status"]
     print("✅ Validation status retrieved:")
     print(f"   Validator: {status['validatorAddress']}")
     print(f"   Agent ID: {status['agentId']}")
@@ -147,14 +140,14 @@ def main():
 
     # Step 5: Get validation summary for agent
     print("📋 Step 5: Getting validation summary for agent...")
-    summary = agent_sdk.validation.get_summary(agent_id, [validator_address])
+    summary = overview["summary"]
     print("✅ Validation summary:")
     print(f"   Validation Count: {summary['count']}")
     print(f"   Average Response: {summary['avgResponse']} / 100\n")
 
     # Step 6: Get all validation requests for agent
     print("📋 Step 6: Getting all validations for agent...")
-    agent_validations = agent_sdk.validation.get_agent_validations(agent_id)
+    agent_validations = overview["agentValidations"]
     print("✅ Agent validations retrieved:")
     print(f"   Total validations: {len(agent_validations)}")
     for i, req_hash in enumerate(agent_validations):
@@ -163,7 +156,7 @@ def main():
 
     # Step 7: Get all requests handled by validator
     print("📋 Step 7: Getting all requests for validator...")
-    validator_requests = validator_sdk.validation.get_validator_requests(validator_address)
+    validator_requests = overview["validatorRequests"]
     print("✅ Validator requests retrieved:")
     print(f"   Total requests: {len(validator_requests)}")
     for i, req_hash in enumerate(validator_requests):
@@ -184,15 +177,18 @@ def main():
 
     # Validator provides partial success response
     print("📋 Step 9: Validator providing partial response...")
-    validator_sdk.validation.validation_response(
+    # Only broadcast here; the receipt is awaited right before it is needed
+    response2 = validator_sdk.validation.validation_response(
         request_hash=request2["requestHash"],
         response=75,  # Partial success
         tag="tee-attestation",
+        wait=False,
     )
     print("✅ Response provided (75 - partial success)\n")
 
-    # Step 10: Get updated summary
+    # Step 10: Get updated summary once the step 9 response is mined
     print("📋 Step 10: Getting updated validation summary...")
+    validator_adapter.wait_for_transaction(response2["txHash"])
     updated_summary = agent_sdk.validation.get_summary(agent_id)
     print("✅ Updated validation summary:")
     print(f"   Validation Count: {updated_summary['count']}")
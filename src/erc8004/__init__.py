@@ -8,10 +8,9 @@ All "MAY" fields are optional, not mandatory.
 Uses adapter pattern to support any blockchain library.
 """
 
-from .adapters import BlockchainAdapter, Web3Adapter
-from .client import ERC8004Client
-from .identity import IdentityClient
-from .reputation import ReputationClient
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
 from .types import (
     AgentRegistrationFile,
     ContractAddresses,
@@ -22,18 +21,57 @@ from .types import (
     Summary,
     ValidationStatus,
 )
-from .utils.ipfs import (
-    IPFSClient,
-    IPFSClientConfig,
-    IPFSUploadResult,
-    cid_to_bytes32,
-    create_ipfs_client,
-    ipfs_uri_to_bytes32,
-)
-from .validation import ValidationClient
+
+if TYPE_CHECKING:
+    from .adapters import BlockchainAdapter, Web3Adapter
+    from .client import ERC8004Client
+    from .identity import IdentityClient
+    from .reputation import ReputationClient
+    from .utils.ipfs import (
+        IPFSClient,
+        IPFSClientConfig,
+        IPFSUploadResult,
+        cid_to_bytes32,
+        compute_cidv0,
+        create_ipfs_client,
+        ipfs_uri_to_bytes32,
+    )
+    from .validation import ValidationClient
 
 __version__ = "0.1.0"
 
+# Clients, adapters and IPFS helpers are imported on first access, so IPFS-only
+# users and early-exiting scripts don't pay for loading web3 and eth-account
+_LAZY_EXPORTS = {
+    "ERC8004Client": ".client",
+    "IdentityClient": ".identity",
+    "ReputationClient": ".reputation",
+    "ValidationClient": ".validation",
+    "BlockchainAdapter": ".adapters",
+    "Web3Adapter": ".adapters",
+    "IPFSClient": ".utils.ipfs",
+    "IPFSClientConfig": ".utils.ipfs",
+    "IPFSUploadResult": ".utils.ipfs",
+    "cid_to_bytes32": ".utils.ipfs",
+    "compute_cidv0": ".utils.ipfs",
+    "ipfs_uri_to_bytes32": ".utils.ipfs",
+    "create_ipfs_client": ".utils.ipfs",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
 __all__ = [
     # Main client
     "ERC8004Client",
@@ -58,6 +96,7 @@ __all__ = [
     "IPFSClientConfig",
     "IPFSUploadResult",
     "cid_to_bytes32",
+    "compute_cidv0",
     "ipfs_uri_to_bytes32",
     "create_ipfs_client",
 ]
@@ -2,7 +2,21 @@
 Blockchain adapters for ERC-8004 SDK
 """
 
+from typing import TYPE_CHECKING, Any
+
 from .base import BlockchainAdapter
-from .web3_adapter import Web3Adapter
+
+if TYPE_CHECKING:
+    from .web3_adapter import Web3Adapter
+
+
+def __getattr__(name: str) -> Any:
+    # Deferred so that importing the adapter interface doesn't load web3
+    if name == "Web3Adapter":
+        from .web3_adapter import Web3Adapter
+
+        return Web3Adapter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["BlockchainAdapter", "Web3Adapter"]
@@ -3,16 +3,29 @@ Adapter interface for blockchain interactions
 Allows SDK to work with any blockchain library (Web3.py, etc.)
 """
 
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+# (contract_address, abi, function_name, args) for call_batch and send_batch
+ContractCall = Tuple[str, List[Dict[str, Any]], str, List[Any]]
 
 
 class BlockchainAdapter(ABC):
     """
     Generic blockchain adapter interface
-    Implementations provide library-specific functionality
+    Implementations provide library-specific functionality; subclasses that
+    define __init__ should call super().__init__()
     """
 
+    # Results the default broadcast keeps for wait_for_transaction, oldest first
+    MAX_BROADCAST_RESULTS = 256
+
+    def __init__(self) -> None:
+        self._broadcast_results: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._broadcast_results_lock = threading.Lock()
+
     @abstractmethod
     def call(
         self,
@@ -35,6 +48,19 @@ class BlockchainAdapter(ABC):
         """
         pass
 
+    def call_batch(self, calls: List[ContractCall]) -> List[Any]:
+        """
+        Call several read-only contract functions
+        Adapters that can batch requests should override this to send them in one round-trip
+
+        Args:
+            calls: List of (contract_address, abi, function_name, args) tuples
+
+        Returns:
+            Function return values, in the same order as calls
+        """
+        return [self.call(*call) for call in calls]
+
     @abstractmethod
     def send(
         self,
@@ -54,9 +80,91 @@ class BlockchainAdapter(ABC):
 
         Returns:
             Transaction result with txHash, blockNumber, events, etc.
+
+        Raises:
+            ValueError: If the transaction was mined but reverted
         """
         pass
 
+    def send_batch(
+        self, calls: List[ContractCall], collect_errors: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Send several transactions from the current signer
+        Adapters that manage nonces should override this to broadcast them back to back
+        instead of waiting for each receipt in turn
+
+        Args:
+            calls: List of (contract_address, abi, function_name, args) tuples
+            collect_errors: OPTIONAL return a failed transaction as {"txHash", "error"}
+                (txHash is None if it was never sent) instead of raising, so the
+                results of the other transactions are not lost
+
+        Returns:
+            Transaction results, in the same order as calls
+        """
+        results: List[Dict[str, Any]] = []
+        for call in calls:
+            try:
+                results.append(self.send(*call))
+            except Exception as e:
+                if not collect_errors:
+                    raise
+                results.append({"txHash": None, "error": e})
+        return results
+
+    def broadcast(
+        self,
+        contract_address: str,
+        abi: List[Dict[str, Any]],
+        function_name: str,
+        args: List[Any],
+    ) -> str:
+        """
+        Send a transaction without waiting for it to be mined
+        Adapters that manage nonces should override this; the default falls back
+        to send, which waits for the receipt and keeps the result for
+        wait_for_transaction (the most recent MAX_BROADCAST_RESULTS of them)
+
+        Args:
+            contract_address: Contract address
+            abi: Contract ABI
+            function_name: Function name to call
+            args: Function arguments
+
+        Returns:
+            Transaction hash
+        """
+        result = self.send(contract_address, abi, function_name, args)
+        tx_hash: str = result["txHash"]
+        with self._broadcast_results_lock:
+            self._broadcast_results[tx_hash] = result
+            if len(self._broadcast_results) > self.MAX_BROADCAST_RESULTS:
+                self._broadcast_results.popitem(last=False)
+        return tx_hash
+
+    def wait_for_transaction(self, tx_hash: str) -> Dict[str, Any]:
+        """
+        Wait for a broadcast transaction to be mined
+        Adapters that override broadcast should override this too; the default
+        returns the result kept by the default broadcast
+
+        Args:
+            tx_hash: Transaction hash returned by broadcast
+
+        Returns:
+            Transaction result with txHash, blockNumber and receipt
+
+        Raises:
+            ValueError: If tx_hash was not broadcast through this adapter, or its
+                result was already returned or evicted
+        """
+        with self._broadcast_results_lock:
+            result = self._broadcast_results.pop(tx_hash, None)
+        if result is None:
+            raise ValueError(f"Transaction {tx_hash} was not broadcast by this adapter")
+        return result
+
     @abstractmethod
     def get_address(self) -> Optional[str]:
         """
@@ -2,15 +2,39 @@
 Web3.py adapter implementation
 """
 
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
+from eth_abi.exceptions import DecodingError
 from eth_account import Account
-from eth_account.messages import encode_defunct
+from eth_account.messages import (
+    SignableMessage,
+    encode_defunct,
+    hash_domain,
+    hash_eip712_message,
+)
+from hexbytes import HexBytes
 from web3 import Web3
 from web3.contract import Contract
-from web3.types import TxReceipt
+from web3.exceptions import BadFunctionCallOutput
+from web3.types import BlockIdentifier, TxParams, TxReceipt
 
-from .base import BlockchainAdapter
+from .base import BlockchainAdapter, ContractCall
+
+# Function selector, input types and output types for a read function
+ReadCodec = Tuple[bytes, List[str], List[str]]
+
+
+def _normalize_output(abi_type: str, value: Any) -> Any:
+    """Helper: checksum decoded addresses and turn arrays into lists, as web3 does"""
+    if abi_type.endswith("]"):
+        item_type = abi_type[: abi_type.rindex("[")]
+        return [_normalize_output(item_type, item) for item in value]
+    if abi_type == "address":
+        return Web3.to_checksum_address(value)
+    return value
 
 
 class Web3Adapter(BlockchainAdapter):
@@ -23,6 +47,12 @@ class Web3Adapter(BlockchainAdapter):
         web3: Web3,
         account: Optional[Account] = None,
         private_key: Optional[str] = None,
+        gas_price_ttl: float = 2.0,
+        receipt_poll_latency: float = 0.1,
+        receipt_timeout: float = 120.0,
+        gas_limit: Optional[int] = 2000000,
+        read_concurrency: int = 0,
+        nonce_ttl: float = 2.0,
     ):
         """
         Initialize Web3 adapter
@@ -31,13 +61,113 @@ class Web3Adapter(BlockchainAdapter):
             web3: Web3 instance
             account: Account instance for signing (optional)
             private_key: Private key for signing (optional, will create account)
+            gas_price_ttl: Seconds a fetched gas price is reused for later sends
+                (0 fetches it for every transaction)
+            receipt_poll_latency: Seconds between receipt polls while waiting for a
+                transaction (lower it for instant-mining dev nodes, raise it to save
+                requests against slow chains)
+            receipt_timeout: Seconds to wait for a receipt before giving up
+            gas_limit: Gas limit for every transaction. None estimates each
+                transaction before sending it and adds a 20% margin; registry
+                writes cost more the first time (a new agent, feedback client or
+                metadata key), so an estimate is never reused. Estimation runs
+                against the latest block, so a call that depends on a transaction
+                still pending from the same batch needs a fixed limit
+            read_concurrency: When above 1, call_batch sends its reads as that many
+                concurrent eth_call requests instead of one JSON-RPC batch. Some
+                public providers rate-limit or serialize batches and answer parallel
+                requests sooner, but a new block can land between them; pass
+                call_batch a block_identifier when the reads must be one snapshot.
+                web3's default validation middleware looks up eth_chainId before
+                every request sent outside a batch, so remove it
+                (w3.middleware_onion.remove("validation")) when using this
+            nonce_ttl: Seconds the locally counted nonce is trusted after a send.
+                Sends closer together than this are numbered locally with no
+                node round-trip; after a longer gap the pending transaction count
+                is read again and the larger of it and the local nonce is used, so
+                transactions signed elsewhere in the meantime are skipped over.
+                Within a burst the adapter assumes exclusive use of the key: a
+                send from another process or wallet in that window can take a
+                nonce this adapter is about to use
         """
+        super().__init__()
         self.web3 = web3
 
         if private_key:
             self.account = Account.from_key(private_key)
         else:
             self.account = account
+        self._address: Optional[str] = self.account.address if self.account else None
+
+        # Serializes nonce assignment so the adapter can be shared across threads
+        self._send_lock = threading.RLock()
+
+        # Next nonce to use for the signer and when it was last handed out; counted
+        # locally within nonce_ttl so pipelined sends don't wait on the mempool view
+        self._nonce: Optional[int] = None
+        self._nonce_used_at = 0.0
+        self.nonce_ttl = nonce_ttl
+
+        # The chain ID never changes for a connection; the gas price is reused for
+        # gas_price_ttl seconds so back-to-back sends don't each query it
+        self._chain_id: Optional[int] = None
+        self.gas_price_ttl = gas_price_ttl
+        self.receipt_poll_latency = receipt_poll_latency
+        self.receipt_timeout = receipt_timeout
+        self._gas_price: Optional[Tuple[float, int]] = None
+
+        self.gas_limit = gas_limit
+
+        # Receipt waits for send_async, started on first use; flush() drains them
+        self._receipt_executor: Optional[ThreadPoolExecutor] = None
+        self.read_concurrency = read_concurrency
+        self._read_executor: Optional[ThreadPoolExecutor] = None
+        self._pending: List["Future[Dict[str, Any]]"] = []
+
+        # Contract objects by (address, ABI object); building one parses the whole ABI
+        self._contracts: Dict[Tuple[str, int], Tuple[List[Dict[str, Any]], Contract]] = {}
+
+        # EIP-712 domain separators by domain fields; a domain is fixed per contract
+        self._domain_separators: Dict[Tuple, bytes] = {}
+
+        # Event name by topic hash for each ABI object, used to decode receipt logs
+        self._event_topics: Dict[int, Tuple[List[Dict[str, Any]], Dict[bytes, str]]] = {}
+
+        # Selector and argument/output types of each read function, by ABI object
+        self._read_codecs: Dict[int, Tuple[List[Dict[str, Any]], Dict[str, ReadCodec]]] = {}
+
+    def with_signer(
+        self, account: Optional[Account] = None, private_key: Optional[str] = None
+    ) -> "Web3Adapter":
+        """
+        Create an adapter for another signer on the same connection
+        The new adapter shares this one's Web3 instance and its contract and
+        EIP-712 domain caches; nonce tracking stays per signer
+
+        Args:
+            account: Account instance for signing (optional)
+            private_key: Private key for signing (optional, will create account)
+
+        Returns:
+            Web3Adapter signing as the given account
+        """
+        adapter = Web3Adapter(
+            self.web3,
+            account=account,
+            private_key=private_key,
+            gas_price_ttl=self.gas_price_ttl,
+            receipt_poll_latency=self.receipt_poll_latency,
+            receipt_timeout=self.receipt_timeout,
+            gas_limit=self.gas_limit,
+            read_concurrency=self.read_concurrency,
+            nonce_ttl=self.nonce_ttl,
+        )
+        adapter._chain_id = self._chain_id
+        adapter._contracts = self._contracts
+        adapter._domain_separators = self._domain_separators
+        adapter._event_topics = self._event_topics
+        adapter._read_codecs = self._read_codecs
+        return adapter
 
     def call(
         self,
@@ -47,11 +177,92 @@ class Web3Adapter(BlockchainAdapter):
         args: List[Any],
     ) -> Any:
         """Call a read-only contract function"""
-        contract: Contract = self.web3.eth.contract(
-            address=Web3.to_checksum_address(contract_address), abi=abi
-        )
-        function = getattr(contract.functions, function_name)
-        return function(*args).call()
+        codec = self._get_read_codecs(abi).get(function_name)
+        if codec is None:
+            contract = self._get_contract(contract_address, abi)
+            function = getattr(contract.functions, function_name)
+            return function(*args).call()
+
+        data = self.web3.eth.call(self._encode_read(contract_address, codec, args))
+        return self._decode_read(function_name, codec, data)
+
+    def call_batch(
+        self, calls: List[ContractCall], block_identifier: Optional[BlockIdentifier] = None
+    ) -> List[Any]:
+        """
+        Call several read-only contract functions in a single JSON-RPC batch
+        (or concurrently, see read_concurrency)
+        Reads run against "latest" unless block_identifier is given, so the batch
+        stays one round-trip; pass a block number to pin every call to it when the
+        results must be one consistent snapshot
+        """
+        block = "latest" if block_identifier is None else block_identifier
+        codecs: List[ReadCodec] = []
+        for _, abi, function_name, _ in calls:
+            codec = self._get_read_codecs(abi).get(function_name)
+            if codec is None:
+                return self._call_batch_functions(calls, block)
+            codecs.append(codec)
+
+        transactions = [
+            self._encode_read(contract_address, codec, args)
+            for (contract_address, _, _, args), codec in zip(calls, codecs)
+        ]
+
+        results: List[bytes]
+        if self.read_concurrency > 1 and len(transactions) > 1:
+            results = list(
+                self._get_read_executor().map(
+                    lambda tx: self.web3.eth.call(tx, block), transactions
+                )
+            )
+        else:
+            results = self._call_batch_raw(transactions, block)
+
+        return [
+            self._decode_read(function_name, codec, data)
+            for (_, _, function_name, _), codec, data in zip(calls, codecs, results)
+        ]
+
+    def _call_batch_raw(self, transactions: List[TxParams], block: BlockIdentifier) -> List[bytes]:
+        """Send encoded eth_call transactions as one JSON-RPC batch, returning the raw results"""
+        try:
+            batch = self.web3.batch_requests()
+        except (AttributeError, TypeError):
+            # web3.py < 7 or a provider without batch support: one request per call
+            return [self.web3.eth.call(tx, block) for tx in transactions]
+
+        with batch:
+            for tx in transactions:
+                batch.add(self.web3.eth.call(tx, block))
+            # The batch applies eth_call's result formatter, so these are HexBytes
+            return cast(List[bytes], batch.execute())
+
+    def _get_read_executor(self) -> ThreadPoolExecutor:
+        """Return the thread pool for concurrent reads, starting it on first use"""
+        with self._send_lock:
+            if self._read_executor is None:
+                self._read_executor = ThreadPoolExecutor(
+                    max_workers=self.read_concurrency, thread_name_prefix="erc8004-reads"
+                )
+            return self._read_executor
+
+    def _call_batch_functions(self, calls: List[ContractCall], block: BlockIdentifier) -> List[Any]:
+        """call_batch through web3 contract functions, for reads without a precomputed codec"""
+        functions = [
+            getattr(self._get_contract(contract_address, abi).functions, function_name)(*args)
+            for contract_address, abi, function_name, args in calls
+        ]
+
+        try:
+            batch = self.web3.batch_requests()
+        except (AttributeError, TypeError):
+            return [function.call(block_identifier=block) for function in functions]
+
+        with batch:
+            for function in functions:
+                batch.add(function.call(block_identifier=block))
+            return list(batch.execute())
 
     def send(
         self,
@@ -61,60 +272,326 @@ class Web3Adapter(BlockchainAdapter):
         args: List[Any],
     ) -> Dict[str, Any]:
         """Send a transaction to a contract function"""
+        return self.send_batch([(contract_address, abi, function_name, args)])[0]
+
+    def send_batch(
+        self, calls: List[ContractCall], collect_errors: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Send several transactions back to back with consecutive nonces
+        All transactions are broadcast before waiting for any receipt, so they can
+        be mined in the same block. With collect_errors, a transaction that fails to
+        broadcast or reverts becomes {"txHash", "error"} and the rest still go through
+        """
+        if not self.account:
+            raise ValueError("Account required for write operations")
+
+        contracts: List[Contract] = [
+            self._get_contract(contract_address, abi) for contract_address, abi, _, _ in calls
+        ]
+
+        # Nonce lookup through broadcast must not interleave between threads sharing
+        # this account; the receipt waits below run outside the lock
+        tx_hashes: List[Union[HexBytes, Exception]] = []
+        with self._send_lock:
+            for contract, (_, _, function_name, args) in zip(contracts, calls):
+                try:
+                    tx_hashes.append(self._broadcast(contract, function_name, args))
+                except Exception as e:
+                    if not collect_errors:
+                        raise
+                    tx_hashes.append(e)
+
+        results: List[Dict[str, Any]] = []
+        for contract, (_, abi, _, _), tx_hash in zip(contracts, calls, tx_hashes):
+            if isinstance(tx_hash, Exception):
+                results.append({"txHash": None, "error": tx_hash})
+                continue
+            try:
+                results.append(self._wait_for_result(contract, abi, tx_hash))
+            except Exception as e:
+                if not collect_errors:
+                    raise
+                results.append({"txHash": tx_hash.hex(), "error": e})
+        return results
+
+    def broadcast(
+        self,
+        contract_address: str,
+        abi: List[Dict[str, Any]],
+        function_name: str,
+        args: List[Any],
+    ) -> str:
+        """
+        Sign and broadcast a transaction with the next local nonce, without waiting
+        for the receipt; several broadcasts in a row can be mined in the same block
+        """
+        contract = self._get_contract(contract_address, abi)
+        return self._broadcast(contract, function_name, args).hex()
+
+    def send_async(
+        self,
+        contract_address: str,
+        abi: List[Dict[str, Any]],
+        function_name: str,
+        args: List[Any],
+    ) -> "Future[Dict[str, Any]]":
+        """
+        Broadcast a transaction now and wait for its receipt in the background
+        The nonce is assigned before this returns, so transactions are still sent in
+        call order; the future resolves to the same result send() returns. Call
+        flush() to wait for everything still in flight
+        """
+        contract = self._get_contract(contract_address, abi)
+        with self._send_lock:
+            tx_hash = self._broadcast(contract, function_name, args)
+            if self._receipt_executor is None:
+                self._receipt_executor = ThreadPoolExecutor(
+                    max_workers=4, thread_name_prefix="erc8004-receipts"
+                )
+            future = self._receipt_executor.submit(self._wait_for_result, contract, abi, tx_hash)
+            self._pending.append(future)
+        return future
+
+    def flush(self) -> List[Dict[str, Any]]:
+        """
+        Wait for every send_async transaction not yet flushed
+
+        Returns:
+            Their transaction results, in submission order
+        """
+        with self._send_lock:
+            pending, self._pending = self._pending, []
+        return [future.result() for future in pending]
+
+    def wait_for_transaction(self, tx_hash: str) -> Dict[str, Any]:
+        """Wait for a broadcast transaction to be mined"""
+        receipt = self._wait_for_receipt(HexBytes(tx_hash))
+        return {
+            "txHash": receipt["transactionHash"].hex(),
+            "blockNumber": receipt["blockNumber"],
+            "receipt": receipt,
+        }
+
+    def next_nonce(self) -> int:
+        """
+        Reserve the next nonce for the signer
+        Calls within nonce_ttl of the previous one count up locally; otherwise the
+        pending transaction count is read again and wins if it is ahead, which
+        happens when something else signed for the same key in the meantime
+
+        Returns:
+            Nonce to use for the next transaction
+        """
         if not self.account:
             raise ValueError("Account required for write operations")
 
+        with self._send_lock:
+            now = time.monotonic()
+            if self._nonce is None or now - self._nonce_used_at >= self.nonce_ttl:
+                pending = self.web3.eth.get_transaction_count(self.account.address, "pending")
+                self._nonce = max(pending, self._nonce or 0)
+            nonce = self._nonce
+            self._nonce += 1
+            self._nonce_used_at = now
+            return nonce
+
+    def reset_nonce(self) -> None:
+        """
+        Forget the locally tracked nonce so the next send re-reads it from the node
+        Call this after sending transactions from the same account outside this
+        adapter within nonce_ttl, or after dropping transactions it had sent
+        """
+        with self._send_lock:
+            self._nonce = None
+
+    def _get_contract(self, contract_address: str, abi: List[Dict[str, Any]]) -> Contract:
+        """Return the Contract for an address and ABI, building it on first use"""
+        # Sub-clients keep one ABI list for their lifetime, so its identity is the key.
+        # The list is stored alongside the contract so the id cannot be reused.
+        cache_key = (contract_address.lower(), id(abi))
+        cached = self._contracts.get(cache_key)
+        if cached is not None and cached[0] is abi:
+            return cached[1]
+
         contract: Contract = self.web3.eth.contract(
             address=Web3.to_checksum_address(contract_address), abi=abi
         )
+        self._contracts[cache_key] = (abi, contract)
+        return contract
+
+    def _get_event_topics(self, abi: List[Dict[str, Any]]) -> Dict[bytes, str]:
+        """Return event names keyed by topic hash for an ABI, hashing each signature once"""
+        cached = self._event_topics.get(id(abi))
+        if cached is not None and cached[0] is abi:
+            return cached[1]
 
+        topics: Dict[bytes, str] = {}
+        for event_abi in abi:
+            if event_abi.get("type") != "event" or event_abi.get("anonymous"):
+                continue
+            signature = (
+                f"{event_abi['name']}({','.join(input['type'] for input in event_abi['inputs'])})"
+            )
+            topics.setdefault(bytes(self.web3.keccak(text=signature)), event_abi["name"])
+
+        self._event_topics[id(abi)] = (abi, topics)
+        return topics
+
+    def _get_read_codecs(self, abi: List[Dict[str, Any]]) -> Dict[str, ReadCodec]:
+        """Return (selector, input types, output types) by name for an ABI's view functions"""
+        cached = self._read_codecs.get(id(abi))
+        if cached is not None and cached[0] is abi:
+            return cached[1]
+
+        names = [item.get("name") for item in abi if item.get("type") == "function"]
+        codecs: Dict[str, ReadCodec] = {}
+        for function_abi in abi:
+            if function_abi.get("type") != "function" or function_abi.get(
+                "stateMutability"
+            ) not in ("view", "pure"):
+                continue
+            input_types = [item["type"] for item in function_abi["inputs"]]
+            output_types = [item["type"] for item in function_abi["outputs"]]
+            # Overloads and struct types keep going through web3's contract functions
+            if names.count(function_abi["name"]) > 1 or any(
+                abi_type.startswith("tuple") for abi_type in input_types + output_types
+            ):
+                continue
+            signature = f"{function_abi['name']}({','.join(input_types)})"
+            selector = bytes(self.web3.keccak(text=signature)[:4])
+            codecs[function_abi["name"]] = (selector, input_types, output_types)
+
+        self._read_codecs[id(abi)] = (abi, codecs)
+        return codecs
+
+    def _encode_read(self, contract_address: str, codec: ReadCodec, args: List[Any]) -> TxParams:
+        """Build the eth_call transaction for a read function"""
+        selector, input_types, _ = codec
+        return {
+            "to": Web3.to_checksum_address(contract_address),
+            "data": HexBytes(selector + self.web3.codec.encode(input_types, args)),
+        }
+
+    def _decode_read(self, function_name: str, codec: ReadCodec, data: bytes) -> Any:
+        """Decode eth_call return data the way web3 contract functions return it"""
+        output_types = codec[2]
+        if not data and output_types:
+            raise BadFunctionCallOutput(
+                f"Could not decode contract function call to {function_name} with return "
+                "data: b'', is the contract deployed on this chain?"
+            )
+
+        try:
+            decoded = self.web3.codec.decode(output_types, data)
+        except DecodingError as e:
+            raise BadFunctionCallOutput(
+                f"Could not decode contract function call to {function_name} with return "
+                f"data: {data!r}"
+            ) from e
+
+        values = [
+            _normalize_output(abi_type, value) for abi_type, value in zip(output_types, decoded)
+        ]
+        return values[0] if len(values) == 1 else values
+
+    def _broadcast(self, contract: Contract, function_name: str, args: List[Any]) -> HexBytes:
+        """Sign and send one transaction with the next nonce, returning its hash"""
+        if not self.account:
+            raise ValueError("Account required for write operations")
+
+        with self._send_lock:
+            try:
+                return self._sign_and_send(contract, function_name, args, self.next_nonce())
+            except Exception:
+                # The reserved nonce may not have been used; resync from the node
+                self.reset_nonce()
+                raise
+
+    def _sign_and_send(
+        self, contract: Contract, function_name: str, args: List[Any], nonce: int
+    ) -> HexBytes:
+        """Build, sign and broadcast a transaction, returning its hash"""
         # Build transaction
-        function = getattr(contract.functions, function_name)
-        transaction = function(*args).build_transaction(
+        function = getattr(contract.functions, function_name)(*args)
+        transaction = function.build_transaction(
             {
                 "from": self.account.address,
-                "nonce": self.web3.eth.get_transaction_count(self.account.address),
-                "gas": 2000000,  # Adjust as needed
-                "gasPrice": self.web3.eth.gas_price,
+                "nonce": nonce,
+                "gas": self._get_gas_limit(function),
+                "gasPrice": self._get_gas_price(),
+                "chainId": self.get_chain_id(),
             }
         )
 
-        # Sign transaction
-        signed_txn = self.web3.eth.account.sign_transaction(
-            transaction, private_key=self.account.key
-        )
+        # Sign transaction with the adapter's account, which already holds the parsed key
+        signed_txn = self.account.sign_transaction(transaction)
 
         # Send transaction (handle both raw_transaction and rawTransaction for compatibility)
-        raw_tx = getattr(signed_txn, 'raw_transaction', None) or getattr(signed_txn, 'rawTransaction', None)
-        tx_hash = self.web3.eth.send_raw_transaction(raw_tx)
+        raw_tx: bytes = getattr(signed_txn, "raw_transaction", None) or getattr(
+            signed_txn, "rawTransaction"
+        )
+        return self.web3.eth.send_raw_transaction(raw_tx)
+
+    def _get_gas_limit(self, function: Any) -> int:
+        """Return the configured gas limit, or a fresh estimate with a 20% margin"""
+        if self.gas_limit is not None:
+            return self.gas_limit
+        estimate: int = function.estimate_gas({"from": self.account.address})
+        return estimate * 6 // 5
+
+    def _get_gas_price(self) -> int:
+        """Return the node's gas price, refetching it once gas_price_ttl has passed"""
+        now = time.monotonic()
+        if self._gas_price is None or now - self._gas_price[0] >= self.gas_price_ttl:
+            self._gas_price = (now, self.web3.eth.gas_price)
+        return self._gas_price[1]
+
+    def _wait_for_receipt(self, tx_hash: Any) -> TxReceipt:
+        """
+        Poll for a transaction receipt with the adapter's latency and timeout
+
+        Raises:
+            ValueError: If the transaction was mined but reverted
+        """
+        receipt = self.web3.eth.wait_for_transaction_receipt(
+            tx_hash, timeout=self.receipt_timeout, poll_latency=self.receipt_poll_latency
+        )
+        if receipt.get("status") == 0:
+            raise ValueError(
+                f"Transaction {receipt['transactionHash'].hex()} reverted "
+                f"in block {receipt['blockNumber']}"
+            )
+        return receipt
 
+    def _wait_for_result(
+        self, contract: Contract, abi: List[Dict[str, Any]], tx_hash: Any
+    ) -> Dict[str, Any]:
+        """Wait for a transaction receipt and decode the contract's events from it"""
         # Wait for receipt
-        receipt: TxReceipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+        receipt = self._wait_for_receipt(tx_hash)
 
         # Parse events from receipt
+        event_topics = self._get_event_topics(abi)
         events = []
         for log in receipt["logs"]:
+            if not log["topics"]:
+                continue
+            event_name = event_topics.get(bytes(log["topics"][0]))
+            if event_name is None:
+                # Not an event of this contract's ABI
+                continue
             try:
-                # Try to decode each log with the contract ABI
-                # Iterate through all events in the ABI to find a match
-                for event_abi in [item for item in abi if item.get('type') == 'event']:
-                    try:
-                        event_signature = self.web3.keccak(text=f"{event_abi['name']}({','.join([input['type'] for input in event_abi['inputs']])})")
-                        if log['topics'][0] == event_signature:
-                            # Decode the event
-                            decoded = contract.events[event_abi['name']]().process_log(log)
-                            events.append(
-                                {
-                                    "name": decoded["event"],
-                                    "args": dict(decoded["args"]),
-                                }
-                            )
-                            break
-                    except Exception:
-                        continue
+                decoded = contract.events[event_name]().process_log(log)
             except Exception:
-                # Skip logs that don't match this contract's ABI
-                pass
+                # Same signature but a different indexed layout (another contract)
+                continue
+            events.append(
+                {
+                    "name": decoded["event"],
+                    "args": dict(decoded["args"]),
+                }
+            )
 
         return {
             "txHash": receipt["transactionHash"].hex(),
@@ -125,13 +602,13 @@ class Web3Adapter(BlockchainAdapter):
 
     def get_address(self) -> Optional[str]:
         """Get the current signer/wallet address"""
-        if not self.account:
-            return None
-        return self.account.address
+        return self._address
 
     def get_chain_id(self) -> int:
-        """Get the chain ID"""
-        return self.web3.eth.chain_id
+        """Get the chain ID (queried once per adapter)"""
+        if self._chain_id is None:
+            self._chain_id = self.web3.eth.chain_id
+        return self._chain_id
 
     def sign_message(self, message: bytes) -> str:
         """
@@ -152,7 +629,8 @@ class Web3Adapter(BlockchainAdapter):
             signable_message, private_key=self.account.key
         )
 
-        return signed_message.signature.hex()
+        signature: HexBytes = signed_message.signature
+        return signature.hex()
 
     def sign_typed_data(
         self, domain: Dict[str, Any], types: Dict[str, Any], value: Dict[str, Any]
@@ -171,17 +649,20 @@ class Web3Adapter(BlockchainAdapter):
         if not self.account:
             raise ValueError("Account required for signing")
 
-        # Construct EIP-712 structured data
-        structured_data = {
-            "types": types,
-            "primaryType": list(types.keys())[0],
-            "domain": domain,
-            "message": value,
-        }
+        # The domain separator only depends on the domain, so hash it once per domain
+        domain_key = tuple(sorted(domain.items()))
+        domain_separator = self._domain_separators.get(domain_key)
+        if domain_separator is None:
+            domain_separator = hash_domain(domain)
+            self._domain_separators[domain_key] = domain_separator
 
-        # Use Account.sign_typed_data directly (newer eth-account API)
-        signed_message = Account.sign_typed_data(
-            structured_data, private_key=self.account.key
+        message_types = {name: fields for name, fields in types.items() if name != "EIP712Domain"}
+        signable_message = SignableMessage(
+            version=b"\x01",
+            header=domain_separator,
+            body=hash_eip712_message(message_types, value),
         )
+        signed_message = self.account.sign_message(signable_message)
 
-        return signed_message.signature.hex()
+        signature: HexBytes = signed_message.signature
+        return signature.hex()
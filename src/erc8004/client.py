@@ -26,7 +26,7 @@ client = ERC8004Client(
 ```
 """
 
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 from .adapters.base import BlockchainAdapter
 from .identity import IdentityClient
@@ -38,20 +38,36 @@ from .validation import ValidationClient
 class ERC8004Client:
     """Main client for interacting with ERC-8004 protocol"""
 
-    def __init__(self, adapter: BlockchainAdapter, addresses: ContractAddresses):
+    def __init__(
+        self,
+        adapter: BlockchainAdapter,
+        addresses: ContractAddresses,
+        identity_cache_size: int = 0,
+        registration_fetch_timeout: float = 10.0,
+    ):
         """
         Initialize ERC-8004 Client
 
         Args:
             adapter: Blockchain adapter instance (Web3Adapter, etc.)
             addresses: Contract addresses configuration
+            identity_cache_size: OPTIONAL size of the identity read cache
+                (see IdentityClient; 0 disables it)
+            registration_fetch_timeout: OPTIONAL seconds to wait when fetching an
+                agent registration file (see IdentityClient)
         """
         self.adapter = adapter
         self.addresses = addresses
 
+        # The chain ID is part of the configuration, so only ask the node when it's missing
+        self._chain_id: Optional[int] = addresses.get("chainId")
+
         # Initialize sub-clients
         self.identity = IdentityClient(
-            self.adapter, self.addresses["identityRegistry"]
+            self.adapter,
+            self.addresses["identityRegistry"],
+            cache_size=identity_cache_size,
+            fetch_timeout=registration_fetch_timeout,
         )
 
         self.reputation = ReputationClient(
@@ -64,6 +80,16 @@ class ERC8004Client:
             self.adapter, self.addresses["validationRegistry"]
         )
 
+    def close(self) -> None:
+        """Close the HTTP session the identity client uses for registration files"""
+        self.identity.close()
+
+    def __enter__(self) -> "ERC8004Client":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     def get_address(self) -> Optional[str]:
         """
         Get the current signer/wallet address
@@ -78,12 +104,16 @@ class ERC8004Client:
         """
         Get the chain ID
 
+        Uses the configured chainId when present, otherwise queries the adapter once
+
         Returns:
             Chain ID
         """
-        return self.adapter.get_chain_id()
+        if self._chain_id is None:
+            self._chain_id = self.adapter.get_chain_id()
+        return self._chain_id
 
-    def get_addresses(self) -> Dict[str, any]:
+    def get_addresses(self) -> Dict[str, Any]:
         """
         Get the configured contract addresses
 
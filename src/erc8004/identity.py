@@ -3,38 +3,72 @@ Identity Client for ERC-8004
 Handles agent registration and identity management
 """
 
-import json
-import os
-from typing import Dict, List, Optional
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from .adapters.base import BlockchainAdapter
+from .adapters.base import BlockchainAdapter, ContractCall
 from .types import AgentRegistrationFile, MetadataEntry
+from .utils.abi import load_abi
+from .utils.jsonlib import loads as json_loads
 
 
 class IdentityClient:
     """Client for interacting with the ERC-8004 Identity Registry"""
 
-    def __init__(self, adapter: BlockchainAdapter, contract_address: str):
+    def __init__(
+        self,
+        adapter: BlockchainAdapter,
+        contract_address: str,
+        cache_size: int = 0,
+        fetch_timeout: float = 10.0,
+    ):
         """
         Initialize Identity Client
 
         Args:
             adapter: Blockchain adapter instance
             contract_address: Address of the Identity Registry contract
+            cache_size: OPTIONAL number of token URI / metadata reads to keep in an
+                LRU cache (0 disables caching). Writes made through this client
+                invalidate the affected entries; writes made elsewhere are only seen
+                after clear_cache()
+            fetch_timeout: Seconds to wait on a registration file host before
+                giving up, so one unresponsive URI cannot stall get_registration_files
         """
         self.adapter = adapter
         self.contract_address = contract_address
 
-        # Load ABI
-        abi_path = os.path.join(
-            os.path.dirname(__file__), "abis", "IdentityRegistry.json"
-        )
-        with open(abi_path, "r") as f:
-            self.abi = json.load(f)
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # Load ABI (shared across clients)
+        self.abi = load_abi("IdentityRegistry")
+
+        # Registration files are fetched over one pooled session so repeated
+        # lookups against the same gateway or host reuse their connections
+        self.session = requests.Session()
+        http_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self.session.mount("https://", http_adapter)
+        self.session.mount("http://", http_adapter)
+        self.fetch_timeout = fetch_timeout
+
+    def close(self) -> None:
+        """Close the registration file session and its pooled connections"""
+        self.session.close()
+
+    def __enter__(self) -> "IdentityClient":
+        return self
 
-    def register(self) -> Dict[str, any]:
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def register(self) -> Dict[str, Any]:
         """
         Register a new agent with no URI (URI can be set later)
         Spec: function register() returns (uint256 agentId)
@@ -51,7 +85,39 @@ class IdentityClient:
 
         return {"agentId": agent_id, "txHash": result["txHash"]}
 
-    def register_with_uri(self, token_uri: str) -> Dict[str, any]:
+    def register_many(self, count: int) -> List[Dict[str, Any]]:
+        """
+        Register several new agents with no URI
+        The register() transactions are broadcast back to back, so they can be mined
+        together instead of waiting one block per agent
+
+        Args:
+            count: Number of agents to register
+
+        Returns:
+            One dictionary per agent, in submission order: agentId and txHash, or
+            txHash and error (txHash is None if it was never sent) for a registration
+            that failed. Each agentId is read from that transaction's own receipt
+        """
+        results = self.adapter.send_batch(
+            [(self.contract_address, self.abi, "register", []) for _ in range(count)],
+            collect_errors=True,
+        )
+
+        registrations: List[Dict[str, Any]] = []
+        for result in results:
+            if "error" in result:
+                registrations.append({"txHash": result["txHash"], "error": result["error"]})
+                continue
+            try:
+                agent_id = self._extract_agent_id_from_receipt(result)
+            except ValueError as e:
+                registrations.append({"txHash": result["txHash"], "error": e})
+                continue
+            registrations.append({"agentId": agent_id, "txHash": result["txHash"]})
+        return registrations
+
+    def register_with_uri(self, token_uri: str) -> Dict[str, Any]:
         """
         Register a new agent with a token URI
         Spec: function register(string tokenURI) returns (uint256 agentId)
@@ -60,19 +126,18 @@ class IdentityClient:
             token_uri: URI pointing to agent registration file (MAY use ipfs://, https://, etc.)
 
         Returns:
-            Dictionary with agentId and txHash
+            Dictionary with agentId, txHash, uri and blockNumber, taken from the
+            Registered event so no tokenURI() call is needed afterwards
         """
         result = self.adapter.send(
             self.contract_address, self.abi, "register", [token_uri]
         )
 
-        agent_id = self._extract_agent_id_from_receipt(result)
-
-        return {"agentId": agent_id, "txHash": result["txHash"]}
+        return self._registration_from_receipt(result)
 
     def register_with_metadata(
         self, token_uri: str, metadata: Optional[List[MetadataEntry]] = None
-    ) -> Dict[str, any]:
+    ) -> Dict[str, Any]:
         """
         Register a new agent with URI and optional on-chain metadata
         Spec: function register(string tokenURI, MetadataEntry[] calldata metadata) returns (uint256 agentId)
@@ -82,24 +147,21 @@ class IdentityClient:
             metadata: OPTIONAL on-chain metadata entries
 
         Returns:
-            Dictionary with agentId and txHash
+            Dictionary with agentId, txHash, uri and blockNumber
         """
         if metadata is None:
             metadata = []
 
         # Convert metadata to contract format - NEW: strings instead of bytes
-        # Field names: metadataKey and metadataValue (not key/value)
-        metadata_formatted = [
-            {"metadataKey": m["key"], "metadataValue": m["value"]} for m in metadata
-        ]
+        # Struct fields are (metadataKey, metadataValue); positional tuples skip web3's
+        # name-to-position conversion of dict arguments
+        metadata_formatted = [(m["key"], m["value"]) for m in metadata]
 
         result = self.adapter.send(
             self.contract_address, self.abi, "register", [token_uri, metadata_formatted]
         )
 
-        agent_id = self._extract_agent_id_from_receipt(result)
-
-        return {"agentId": agent_id, "txHash": result["txHash"]}
+        return self._registration_from_receipt(result)
 
     def get_token_uri(self, agent_id: int) -> str:
         """
@@ -112,7 +174,8 @@ class IdentityClient:
         Returns:
             URI string (MAY be ipfs://, https://, etc.)
         """
-        return self.adapter.call(self.contract_address, self.abi, "tokenURI", [agent_id])
+        token_uri: str = self._cached_call("tokenURI", [agent_id])
+        return token_uri
 
     def set_agent_uri(self, agent_id: int, new_uri: str) -> Dict[str, str]:
         """
@@ -130,6 +193,7 @@ class IdentityClient:
         result = self.adapter.send(
             self.contract_address, self.abi, "setAgentUri", [agent_id, new_uri]
         )
+        self._invalidate(("tokenURI", agent_id))
 
         return {"txHash": result["txHash"]}
 
@@ -144,7 +208,8 @@ class IdentityClient:
         Returns:
             Owner address
         """
-        return self.adapter.call(self.contract_address, self.abi, "ownerOf", [agent_id])
+        owner: str = self.adapter.call(self.contract_address, self.abi, "ownerOf", [agent_id])
+        return owner
 
     def get_metadata(self, agent_id: int, key: str) -> str:
         """
@@ -159,10 +224,41 @@ class IdentityClient:
             Metadata value as string
         """
         # NEW: Returns string directly, no bytes conversion needed
-        return self.adapter.call(
-            self.contract_address, self.abi, "getMetadata", [agent_id, key]
+        value: str = self._cached_call("getMetadata", [agent_id, key])
+        return value
+
+    def get_agent_info(
+        self, agent_id: int, metadata_keys: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Get owner, token URI and on-chain metadata for an agent in one batched read
+        Uses the adapter's call_batch, so supporting adapters need a single round-trip
+
+        Args:
+            agent_id: The agent's ID
+            metadata_keys: OPTIONAL metadata keys to read
+
+        Returns:
+            Dictionary with owner, tokenURI and metadata (key -> value)
+        """
+        keys = metadata_keys or []
+
+        calls: List[ContractCall] = [
+            (self.contract_address, self.abi, "ownerOf", [agent_id]),
+            (self.contract_address, self.abi, "tokenURI", [agent_id]),
+        ]
+        calls.extend(
+            (self.contract_address, self.abi, "getMetadata", [agent_id, key]) for key in keys
         )
 
+        results = self.adapter.call_batch(calls)
+
+        return {
+            "owner": results[0],
+            "tokenURI": results[1],
+            "metadata": dict(zip(keys, results[2:])),
+        }
+
     def set_metadata(self, agent_id: int, key: str, value: str) -> Dict[str, str]:
         """
         Set on-chain metadata for an agent
@@ -183,6 +279,7 @@ class IdentityClient:
             "setMetadata",
             [agent_id, key, value],
         )
+        self._invalidate(("getMetadata", agent_id, key))
 
         return {"txHash": result["txHash"]}
 
@@ -199,35 +296,130 @@ class IdentityClient:
         Returns:
             Parsed agent registration file
         """
-        uri = self.get_token_uri(agent_id)
+        return self._fetch_registration_file(self.get_token_uri(agent_id))
+
+    def get_registration_files(
+        self, agent_ids: List[int], max_workers: int = 8
+    ) -> List[AgentRegistrationFile]:
+        """
+        Fetch and parse the registration files of several agents
+        The token URIs are read with one call_batch and the files are then fetched
+        in parallel, instead of one URI read and one download after another
+
+        Args:
+            agent_ids: The agents' IDs
+            max_workers: Maximum number of files downloaded at once
 
+        Returns:
+            Parsed agent registration files, in the same order as agent_ids
+        """
+        if not agent_ids:
+            return []
+
+        uris = self.adapter.call_batch(
+            [(self.contract_address, self.abi, "tokenURI", [agent_id]) for agent_id in agent_ids]
+        )
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(uris))) as executor:
+            return list(executor.map(self._fetch_registration_file, uris))
+
+    def clear_cache(self) -> None:
+        """
+        Drop all cached token URI and metadata reads
+        Use this when the registry may have been updated by another client
+        """
+        with self._cache_lock:
+            self._cache.clear()
+
+    def _fetch_registration_file(self, uri: str) -> AgentRegistrationFile:
+        """
+        Helper: Download and parse a registration file from its token URI
+        """
         # Handle different URI schemes
         if uri.startswith("ipfs://"):
             # IPFS gateway - using public gateway
-            cid = uri.replace("ipfs://", "")
+            cid = uri[len("ipfs://"):]
             http_uri = f"https://ipfs.io/ipfs/{cid}"
-            response = requests.get(http_uri)
-            response.raise_for_status()
-            return response.json()
         elif uri.startswith("https://") or uri.startswith("http://"):
-            response = requests.get(uri)
-            response.raise_for_status()
-            return response.json()
+            http_uri = uri
         else:
             raise ValueError(f"Unsupported URI scheme: {uri}")
 
+        response = self.session.get(http_uri, timeout=self.fetch_timeout)
+        response.raise_for_status()
+        registration: AgentRegistrationFile = json_loads(response.content)
+        return registration
+
+    def _cached_call(self, function_name: str, args: List[Any]) -> Any:
+        """
+        Helper: Call a read-only registry function through the LRU cache
+        """
+        if self.cache_size <= 0:
+            return self.adapter.call(self.contract_address, self.abi, function_name, args)
+
+        cache_key = (function_name, *args)
+        with self._cache_lock:
+            if cache_key in self._cache:
+                self._cache.move_to_end(cache_key)
+                return self._cache[cache_key]
+
+        value = self.adapter.call(self.contract_address, self.abi, function_name, args)
+
+        with self._cache_lock:
+            self._cache[cache_key] = value
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return value
+
+    def _invalidate(self, cache_key: Tuple) -> None:
+        """
+        Helper: Forget a cached read after this client changed it on-chain
+        """
+        with self._cache_lock:
+            self._cache.pop(cache_key, None)
+
     def _extract_agent_id_from_receipt(self, result: Dict) -> int:
         """
         Helper: Extract agentId from transaction receipt
         Looks for the Registered event which contains the agentId
         """
+        args = self._extract_registered_event(result)
+        return int(args["agentId"] if "agentId" in args else args[0])
+
+    def _extract_registered_event(self, result: Dict) -> Dict[Any, Any]:
+        """
+        Helper: Return the arguments of the Registered event in a transaction result
+        """
         if "events" in result:
             for event in result["events"]:
                 if event["name"] == "Registered":
-                    args = event["args"]
-                    return int(args.get("agentId", args.get(0)))
+                    args: Dict[Any, Any] = event["args"]
+                    return args
 
         raise ValueError(
             "Could not extract agentId from transaction receipt - Registered event not found"
         )
 
+    def _registration_from_receipt(self, result: Dict) -> Dict[str, Any]:
+        """
+        Helper: Build a registration result from the Registered event
+        Also seeds the tokenURI cache with the emitted URI
+        """
+        args = self._extract_registered_event(result)
+        agent_id = int(args["agentId"] if "agentId" in args else args[0])
+        uri = args.get("agentUri", args.get(1))
+
+        if self.cache_size > 0:
+            with self._cache_lock:
+                self._cache[("tokenURI", agent_id)] = uri
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return {
+            "agentId": agent_id,
+            "txHash": result["txHash"],
+            "uri": uri,
+            "blockNumber": result.get("blockNumber"),
+        }
+
@@ -3,12 +3,27 @@ Reputation Client for ERC-8004
 Handles feedback submission and reputation queries
 """
 
-import json
-import os
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
-from .adapters.base import BlockchainAdapter
+from .adapters.base import BlockchainAdapter, ContractCall
 from .types import Summary
+from .utils.abi import load_abi, to_bytes32
+
+
+def _unique_addresses(addresses: List[str]) -> List[str]:
+    """Helper: Drop repeated addresses (compared case-insensitively), keeping the first of each"""
+    if len(addresses) < 2:
+        return addresses
+    unique: Dict[str, str] = {}
+    for address in addresses:
+        unique.setdefault(address.lower(), address)
+    return list(unique.values())
+
+
+def _as_list(values: Sequence) -> List:
+    """Helper: Return a decoded array as a list, copying only when it is not one already"""
+    return values if isinstance(values, list) else list(values)
 
 
 class ReputationClient:
@@ -32,12 +47,8 @@ class ReputationClient:
         self.contract_address = contract_address
         self.identity_registry_address = identity_registry_address
 
-        # Load ABI
-        abi_path = os.path.join(
-            os.path.dirname(__file__), "abis", "ReputationRegistry.json"
-        )
-        with open(abi_path, "r") as f:
-            self.abi = json.load(f)
+        # Load ABI (shared across clients)
+        self.abi = load_abi("ReputationRegistry")
 
 
     def give_feedback(
@@ -47,7 +58,8 @@ class ReputationClient:
         tag1: Optional[str] = None,
         tag2: Optional[str] = None,
         feedback_uri: Optional[str] = None,
-        feedback_hash: Optional[str] = None,
+        feedback_hash: Optional[Union[str, bytes]] = None,
+        wait: bool = True,
     ) -> Dict[str, str]:
         """
         Submit feedback for an agent
@@ -60,37 +72,59 @@ class ReputationClient:
             tag1: OPTIONAL tag (now a string, not bytes32)
             tag2: OPTIONAL tag (now a string, not bytes32)
             feedback_uri: OPTIONAL feedback URI
-            feedback_hash: OPTIONAL feedback hash (bytes32)
+            feedback_hash: OPTIONAL feedback hash (bytes32, as hex or bytes)
+            wait: Wait for the transaction to be mined. With False the transaction
+                is only broadcast, so several feedbacks from one signer can be
+                submitted back to back; confirm them later with
+                adapter.wait_for_transaction(txHash)
 
         Returns:
             Dictionary with txHash
         """
-        # Validate score is 0-100 (MUST per spec)
-        if score < 0 or score > 100:
-            raise ValueError("Score MUST be between 0 and 100")
+        args = self._feedback_args(agent_id, score, tag1, tag2, feedback_uri, feedback_hash)
 
-        # NEW: Tags are now strings, pass them directly
-        tag1_str = tag1 or ""
-        tag2_str = tag2 or ""
-        feedback_hash_bytes = bytes.fromhex(feedback_hash[2:]) if feedback_hash else bytes(32)
-        feedback_uri_str = feedback_uri or ""
+        if not wait:
+            tx_hash = self.adapter.broadcast(self.contract_address, self.abi, "giveFeedback", args)
+            return {"txHash": tx_hash}
 
-        result = self.adapter.send(
-            self.contract_address,
-            self.abi,
-            "giveFeedback",
-            [
-                agent_id,
-                score,
-                tag1_str,
-                tag2_str,
-                feedback_uri_str,
-                feedback_hash_bytes,
-            ],
-        )
+        result = self.adapter.send(self.contract_address, self.abi, "giveFeedback", args)
 
         return {"txHash": result["txHash"]}
 
+    def give_feedback_many(self, feedbacks: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+        """
+        Submit several feedbacks from this signer
+        All giveFeedback transactions are validated first and then broadcast back to
+        back, so a bulk import waits for the receipts once instead of once per entry
+
+        Args:
+            feedbacks: Dictionaries with agentId and score, and OPTIONAL tag1, tag2,
+                feedbackUri and feedbackHash (same meaning as give_feedback's arguments)
+
+        Returns:
+            List of dictionaries with txHash, in submission order
+        """
+        calls = [
+            (
+                self.contract_address,
+                self.abi,
+                "giveFeedback",
+                self._feedback_args(
+                    feedback["agentId"],
+                    feedback["score"],
+                    feedback.get("tag1"),
+                    feedback.get("tag2"),
+                    feedback.get("feedbackUri"),
+                    feedback.get("feedbackHash"),
+                ),
+            )
+            for feedback in feedbacks
+        ]
+
+        results = self.adapter.send_batch(calls)
+
+        return [{"txHash": result["txHash"]} for result in results]
+
     def revoke_feedback(self, agent_id: int, feedback_index: int) -> Dict[str, str]:
         """
         Revoke previously submitted feedback
@@ -115,7 +149,7 @@ class ReputationClient:
         client_address: str,
         feedback_index: int,
         response_uri: str,
-        response_hash: Optional[str] = None,
+        response_hash: Optional[Union[str, bytes]] = None,
     ) -> Dict[str, str]:
         """
         Append a response to existing feedback
@@ -126,12 +160,12 @@ class ReputationClient:
             client_address: Client who gave the feedback
             feedback_index: Index of the feedback
             response_uri: URI to response content
-            response_hash: OPTIONAL hash of response content (KECCAK-256)
+            response_hash: OPTIONAL hash of response content (KECCAK-256, as hex or bytes)
 
         Returns:
             Dictionary with txHash
         """
-        hash_bytes = bytes.fromhex(response_hash[2:]) if response_hash else bytes(32)
+        hash_bytes = to_bytes32(response_hash)
 
         result = self.adapter.send(
             self.contract_address,
@@ -150,9 +184,10 @@ class ReputationClient:
         Returns:
             Identity registry address
         """
-        return self.adapter.call(
+        identity_registry: str = self.adapter.call(
             self.contract_address, self.abi, "getIdentityRegistry", []
         )
+        return identity_registry
 
     def get_summary(
         self,
@@ -175,7 +210,7 @@ class ReputationClient:
         Returns:
             Summary dictionary with count and averageScore
         """
-        clients = client_addresses or []
+        clients = _unique_addresses(client_addresses or [])
         # NEW: Tags are now strings, pass them directly
         t1 = tag1 or ""
         t2 = tag2 or ""
@@ -184,11 +219,47 @@ class ReputationClient:
             self.contract_address, self.abi, "getSummary", [agent_id, clients, t1, t2]
         )
 
-        return {"count": int(result[0]), "averageScore": int(result[1])}
+        return self._format_summary(result)
+
+    def get_summaries(
+        self,
+        agent_ids: List[int],
+        client_addresses: Optional[List[str]] = None,
+        tag1: Optional[str] = None,
+        tag2: Optional[str] = None,
+    ) -> List[Summary]:
+        """
+        Get the reputation summary of several agents in one batched read
+        Uses the adapter's call_batch, so supporting adapters need a single round-trip
+
+        Args:
+            agent_ids: The agent IDs
+            client_addresses: OPTIONAL filter by specific clients (applied to every agent)
+            tag1: OPTIONAL filter by tag1
+            tag2: OPTIONAL filter by tag2
+
+        Returns:
+            Summary dictionaries, in the same order as agent_ids
+        """
+        if not agent_ids:
+            return []
+
+        clients = _unique_addresses(client_addresses or [])
+        t1 = tag1 or ""
+        t2 = tag2 or ""
+
+        results = self.adapter.call_batch(
+            [
+                (self.contract_address, self.abi, "getSummary", [agent_id, clients, t1, t2])
+                for agent_id in agent_ids
+            ]
+        )
+
+        return [self._format_summary(result) for result in results]
 
     def read_feedback(
         self, agent_id: int, client_address: str, index: int
-    ) -> Dict[str, any]:
+    ) -> Dict[str, Any]:
         """
         Read a specific feedback entry
         Spec: function readFeedback(uint256 agentId, address clientAddress, uint64 index) returns (uint8 score, string tag1, string tag2, bool isRevoked)
@@ -208,13 +279,7 @@ class ReputationClient:
             [agent_id, client_address, index],
         )
 
-        # NEW: Tags are now strings, no hex conversion needed
-        return {
-            "score": int(result[0]),
-            "tag1": result[1],
-            "tag2": result[2],
-            "isRevoked": bool(result[3]),
-        }
+        return self._format_feedback(result)
 
     def read_all_feedback(
         self,
@@ -239,7 +304,7 @@ class ReputationClient:
         Returns:
             Dictionary with arrays of clientAddresses, scores, tag1s, tag2s, revokedStatuses (tags are now strings)
         """
-        clients = client_addresses or []
+        clients = _unique_addresses(client_addresses or [])
         # NEW: Tags are now strings, pass them directly
         t1 = tag1 or ""
         t2 = tag2 or ""
@@ -251,14 +316,126 @@ class ReputationClient:
             [agent_id, clients, t1, t2, include_revoked],
         )
 
-        # NEW: Tags are now strings, no hex conversion needed
-        return {
-            "clientAddresses": list(result[0]),
-            "scores": [int(s) for s in result[1]],
-            "tag1s": list(result[2]),
-            "tag2s": list(result[3]),
-            "revokedStatuses": [bool(r) for r in result[4]],
+        return self._format_all_feedback(result)
+
+    def iter_feedback(
+        self,
+        agent_id: int,
+        client_addresses: Optional[List[str]] = None,
+        include_revoked: bool = False,
+        page_size: int = 512,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over an agent's feedback entries one page of readFeedback calls at a time
+        Unlike read_all_feedback, the whole history is never decoded in one response;
+        each page is one call_batch of page_size entries, read at the then-latest block
+
+        Args:
+            agent_id: The agent ID
+            client_addresses: OPTIONAL clients to read (default: every client of the agent)
+            include_revoked: OPTIONAL include revoked feedback
+            page_size: Number of feedback entries read per batch
+
+        Yields:
+            Dictionaries with clientAddress, index, score, tag1, tag2 and isRevoked,
+            grouped by client in ascending index order
+
+        Raises:
+            ValueError: If page_size is less than 1 (raised when called, not on iteration)
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+
+        return self._iter_feedback(agent_id, client_addresses, include_revoked, page_size)
+
+    def _iter_feedback(
+        self,
+        agent_id: int,
+        client_addresses: Optional[List[str]],
+        include_revoked: bool,
+        page_size: int,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Helper: Generator behind iter_feedback, with page_size already validated
+        """
+        if client_addresses is None:
+            clients = self.get_clients(agent_id)
+        else:
+            clients = _unique_addresses(client_addresses)
+
+        # Indices run from 1 to the client's last index
+        entries = (
+            (client, index)
+            for start in range(0, len(clients), page_size)
+            for client, last_index in self._last_indexes(
+                agent_id, clients[start : start + page_size]
+            )
+            for index in range(1, last_index + 1)
+        )
+
+        while True:
+            page = list(islice(entries, page_size))
+            if not page:
+                return
+
+            results = self.adapter.call_batch(
+                [
+                    (self.contract_address, self.abi, "readFeedback", [agent_id, client, index])
+                    for client, index in page
+                ]
+            )
+
+            for (client, index), result in zip(page, results):
+                feedback = self._format_feedback(result)
+                if feedback["isRevoked"] and not include_revoked:
+                    continue
+                yield {"clientAddress": client, "index": index, **feedback}
+
+    def get_feedback_overview(
+        self,
+        agent_id: int,
+        client_address: Optional[str] = None,
+        feedback_index: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Read an agent's summary, clients and feedback in one batched read
+        Uses the adapter's call_batch, so supporting adapters need a single round-trip
+
+        Args:
+            agent_id: The agent ID
+            client_address: OPTIONAL client whose feedback entry to include
+            feedback_index: OPTIONAL index of that client's feedback entry
+
+        Returns:
+            Dictionary with summary, clients and allFeedback (unfiltered, revoked
+            excluded), plus feedback when client_address and feedback_index are given
+        """
+        calls: List[ContractCall] = [
+            (self.contract_address, self.abi, "getSummary", [agent_id, [], "", ""]),
+            (self.contract_address, self.abi, "getClients", [agent_id]),
+            (self.contract_address, self.abi, "readAllFeedback", [agent_id, [], "", "", False]),
+        ]
+        if client_address is not None and feedback_index is not None:
+            calls.append(
+                (
+                    self.contract_address,
+                    self.abi,
+                    "readFeedback",
+                    [agent_id, client_address, feedback_index],
+                )
+            )
+
+        results = self.adapter.call_batch(calls)
+
+        overview = {
+            "summary": self._format_summary(results[0]),
+            "clients": results[1],
+            "allFeedback": self._format_all_feedback(results[2]),
         }
+        if len(results) > 3:
+            overview["feedback"] = self._format_feedback(results[3])
+
+        return overview
 
     def get_response_count(
         self,
@@ -305,7 +482,10 @@ class ReputationClient:
         Returns:
             List of client addresses
         """
-        return self.adapter.call(self.contract_address, self.abi, "getClients", [agent_id])
+        clients: List[str] = self.adapter.call(
+            self.contract_address, self.abi, "getClients", [agent_id]
+        )
+        return clients
 
     def get_last_index(self, agent_id: int, client_address: str) -> int:
         """
@@ -324,3 +504,80 @@ class ReputationClient:
         )
 
         return int(result)
+
+    def _last_indexes(self, agent_id: int, clients: List[str]) -> List[Tuple[str, int]]:
+        """
+        Helper: Read getLastIndex for several clients in one batch
+        """
+        results = self.adapter.call_batch(
+            [
+                (self.contract_address, self.abi, "getLastIndex", [agent_id, client])
+                for client in clients
+            ]
+        )
+        return [(client, int(result)) for client, result in zip(clients, results)]
+
+    def _feedback_args(
+        self,
+        agent_id: int,
+        score: int,
+        tag1: Optional[str],
+        tag2: Optional[str],
+        feedback_uri: Optional[str],
+        feedback_hash: Optional[Union[str, bytes]],
+    ) -> List:
+        """
+        Helper: Validate feedback and build the giveFeedback arguments
+        """
+        # Validate score is an integer 0-100 (MUST per spec); bools and floats would
+        # otherwise only fail later inside ABI encoding
+        if isinstance(score, bool) or not isinstance(score, int) or not 0 <= score <= 100:
+            raise ValueError("Score MUST be an integer between 0 and 100")
+
+        # NEW: Tags are now strings, pass them directly
+        tag1_str = tag1 or ""
+        tag2_str = tag2 or ""
+        feedback_hash_bytes = to_bytes32(feedback_hash)
+        feedback_uri_str = feedback_uri or ""
+
+        return [
+            agent_id,
+            score,
+            tag1_str,
+            tag2_str,
+            feedback_uri_str,
+            feedback_hash_bytes,
+        ]
+
+    def _format_summary(self, result: List) -> Summary:
+        """
+        Helper: Convert a getSummary return tuple to a Summary
+        """
+        return {"count": int(result[0]), "averageScore": int(result[1])}
+
+    def _format_feedback(self, result: List) -> Dict[str, Any]:
+        """
+        Helper: Convert a readFeedback return tuple to a feedback dictionary
+        """
+        # NEW: Tags are now strings, no hex conversion needed
+        return {
+            "score": int(result[0]),
+            "tag1": result[1],
+            "tag2": result[2],
+            "isRevoked": bool(result[3]),
+        }
+
+    def _format_all_feedback(self, result: List) -> Dict[str, List]:
+        """
+        Helper: Convert readAllFeedback return arrays to a dictionary of lists
+        """
+        # NEW: Tags are now strings, no hex conversion needed
+        # The ABI decoder already yields ints and bools and Web3Adapter returns
+        # arrays as lists, so those are passed through without copying
+        return {
+            "clientAddresses": _as_list(result[0]),
+            "scores": _as_list(result[1]),
+            "tag1s": _as_list(result[2]),
+            "tag2s": _as_list(result[3]),
+            "revokedStatuses": _as_list(result[4]),
+        }
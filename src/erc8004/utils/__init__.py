@@ -5,6 +5,7 @@ from .ipfs import (
     IPFSClientConfig,
     IPFSUploadResult,
     cid_to_bytes32,
+    compute_cidv0,
     create_ipfs_client,
     ipfs_uri_to_bytes32,
 )
@@ -14,6 +15,7 @@ __all__ = [
     "IPFSClientConfig",
     "IPFSUploadResult",
     "cid_to_bytes32",
+    "compute_cidv0",
     "ipfs_uri_to_bytes32",
     "create_ipfs_client",
 ]
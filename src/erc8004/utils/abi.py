@@ -0,0 +1,46 @@
+"""
+Contract ABI loading and argument helpers
+"""
+
+import os
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Union
+
+from .jsonlib import loads as json_loads
+
+
+@lru_cache(maxsize=None)
+def load_abi(name: str) -> List[Dict[str, Any]]:
+    """
+    Load a bundled contract ABI
+    Each file is read and parsed once per process (with orjson when installed);
+    every client shares the returned list, so callers must not modify it
+
+    Args:
+        name: Contract name (e.g. 'IdentityRegistry')
+
+    Returns:
+        Parsed ABI
+    """
+    abi_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "abis", f"{name}.json")
+    with open(abi_path, "rb") as f:
+        abi: List[Dict[str, Any]] = json_loads(f.read())
+    return abi
+
+
+def to_bytes32(value: Optional[Union[str, bytes]]) -> bytes:
+    """
+    Convert an optional bytes32 argument to bytes
+    Bytes pass through unchanged, so callers holding raw hashes skip a hex round-trip
+
+    Args:
+        value: Hex string (with or without 0x), bytes, or None/empty for zero bytes
+
+    Returns:
+        The value as bytes (32 zero bytes when empty)
+    """
+    if not value:
+        return bytes(32)
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value)
+    return bytes.fromhex(value[2:] if value.startswith(("0x", "0X")) else value)
@@ -2,10 +2,28 @@
 IPFS Client Configuration and Utilities
 """
 
+import gzip
+import hashlib
 import json
-from typing import Any, Dict, List, Optional, Union
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .jsonlib import loads as json_loads
+
+
+# Public gateways raced by IPFSClient.fetch_racing when none are given
+PUBLIC_GATEWAYS = [
+    "https://ipfs.io/ipfs/",
+    "https://dweb.link/ipfs/",
+    "https://gateway.pinata.cloud/ipfs/",
+]
 
 
 class IPFSClientConfig:
@@ -18,6 +36,9 @@ class IPFSClientConfig:
         api_secret: Optional[str] = None,
         gateway_url: Optional[str] = None,
         node_url: Optional[str] = None,
+        skip_pinned_uploads: bool = False,
+        fetch_cache_size: int = 256,
+        timeout: float = 30.0,
     ):
         """
         Initialize IPFS client configuration
@@ -28,12 +49,45 @@ class IPFSClientConfig:
             api_secret: API secret (required for Pinata)
             gateway_url: Custom IPFS gateway URL
             node_url: Custom IPFS node URL (for local IPFS)
+            skip_pinned_uploads: Pinata only - compute the CID locally and skip the
+                upload when that CID is already pinned to the account (the existing
+                pin's name and metadata are kept)
+            fetch_cache_size: Number of fetched or uploaded text documents to keep
+                in memory, keyed by CID/path (0 disables). IPFS content is
+                immutable, so cached entries never go stale
+            timeout: Default timeout in seconds for every provider and gateway request
         """
         self.provider = provider
         self.api_key = api_key
         self.api_secret = api_secret
         self.gateway_url = gateway_url or "https://ipfs.io/ipfs/"
         self.node_url = node_url or "http://127.0.0.1:5001"
+        self.skip_pinned_uploads = skip_pinned_uploads
+        self.fetch_cache_size = fetch_cache_size
+        self.timeout = timeout
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies a default timeout to requests that don't set one"""
+
+    def __init__(self, *args: Any, timeout: Optional[float] = None, **kwargs: Any):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Union[None, float, Tuple[Optional[float], Optional[float]]] = None,
+        verify: Union[bool, str] = True,
+        cert: Union[None, str, Tuple[str, str]] = None,
+        proxies: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        if timeout is None:
+            timeout = self.timeout
+        return super().send(
+            request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies
+        )
 
 
 class IPFSUploadResult:
@@ -56,7 +110,7 @@ class IPFSUploadResult:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
-        result = {"cid": self.cid, "uri": self.uri, "url": self.url}
+        result: Dict[str, Any] = {"cid": self.cid, "uri": self.uri, "url": self.url}
         if self.size is not None:
             result["size"] = self.size
         return result
@@ -65,6 +119,18 @@ class IPFSUploadResult:
 # Base58 alphabet (Bitcoin style)
 BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
 
+# All 58 * 58 two-digit base58 values as ASCII bytes, indexed by numeric value and
+# stored least significant digit first so the encoder can append and reverse once
+BASE58_PAIRS_REVERSED = [
+    (low + high).encode("ascii") for high in BASE58_ALPHABET for low in BASE58_ALPHABET
+]
+
+# Digit value of every byte (0xFF for bytes outside the alphabet), so decoding maps
+# the whole input with one bytes.translate instead of searching the alphabet per char
+BASE58_DIGITS = bytes(
+    BASE58_ALPHABET.index(chr(i)) if chr(i) in BASE58_ALPHABET else 0xFF for i in range(256)
+)
+
 
 def base58_decode(input_str: str) -> bytes:
     """
@@ -79,35 +145,70 @@ def base58_decode(input_str: str) -> bytes:
     Raises:
         ValueError: If invalid base58 character encountered
     """
-    bytes_list: List[int] = []
+    try:
+        digits = input_str.encode("ascii").translate(BASE58_DIGITS)
+    except UnicodeEncodeError:
+        digits = b"\xff"
+    if 0xFF in digits:
+        invalid = next(char for char in input_str if char not in BASE58_ALPHABET)
+        raise ValueError(f"Invalid base58 character: {invalid}")
+
+    # Accumulate into one integer so each digit costs a single bigint multiply-add
+    num = 0
+    for digit in digits:
+        num = num * 58 + digit
 
-    for char in input_str:
-        carry = BASE58_ALPHABET.index(char)
-        if carry < 0:
-            raise ValueError(f"Invalid base58 character: {char}")
+    # Handle leading zeros
+    leading_zeros = len(input_str) - len(input_str.lstrip("1"))
 
-        for j in range(len(bytes_list)):
-            carry += bytes_list[j] * 58
-            bytes_list[j] = carry & 0xFF
-            carry >>= 8
+    return b"\x00" * leading_zeros + num.to_bytes((num.bit_length() + 7) // 8, "big")
 
-        while carry > 0:
-            bytes_list.append(carry & 0xFF)
-            carry >>= 8
 
-    # Handle leading zeros
-    for char in input_str:
-        if char != "1":
-            break
-        bytes_list.append(0)
+def base58_encode(data: bytes) -> str:
+    """
+    Encode bytes to a base58 string
+
+    Args:
+        data: Bytes to encode
+
+    Returns:
+        Base58 encoded string
+    """
+    num = int.from_bytes(data, "big")
+
+    # Digits are appended least significant first into one buffer and reversed at
+    # the end, rather than prepended to a new string on every iteration
+    encoded = bytearray()
+    while num > 0:
+        # Emit two digits per bigint divmod, halving the divisions of the wide integer
+        num, remainder = divmod(num, 58 * 58)
+        encoded += BASE58_PAIRS_REVERSED[remainder]
+
+    # The most significant pair may carry a zero ('1') digit
+    while encoded and encoded[-1] == 0x31:
+        encoded.pop()
+
+    # Handle leading zeros: each leading zero byte becomes a '1'
+    encoded += b"1" * (len(data) - len(data.lstrip(b"\x00")))
+
+    encoded.reverse()
+    return encoded.decode("ascii")
 
-    return bytes(reversed(bytes_list))
 
+IPFS_SCHEME = "ipfs://"
 
+
+def _strip_ipfs_scheme(uri: str) -> str:
+    """Remove a leading ipfs:// from a URI, leaving bare CIDs (and any path) unchanged"""
+    return uri[len(IPFS_SCHEME) :] if uri.startswith(IPFS_SCHEME) else uri
+
+
+@lru_cache(maxsize=4096)
 def cid_to_bytes32(cid_str: str) -> str:
     """
     Convert any IPFS CID (v0) to bytes32 hex string
-    Works for Qm... (CIDv0) formats
+    Works for Qm... (CIDv0) formats. Results are cached per CID, since the same
+    CIDs recur across registrations, validation requests and feedback
 
     Args:
         cid_str: The IPFS CID string (v0 like "QmXXX...")
@@ -164,10 +265,77 @@ def ipfs_uri_to_bytes32(uri: str) -> str:
         >>> bytes32 = ipfs_uri_to_bytes32(uri)
     """
     # Remove ipfs:// prefix if present
-    cid = uri.replace("ipfs://", "")
+    cid = _strip_ipfs_scheme(uri)
     return cid_to_bytes32(cid)
 
 
+# Default UnixFS chunk size used by `ipfs add` and the pinning services
+UNIXFS_CHUNK_SIZE = 262144
+
+# Leading bytes of every gzip stream
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def _varint(value: int) -> bytes:
+    """Encode an unsigned integer as a protobuf varint"""
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def compute_cidv0(content: Union[str, bytes]) -> str:
+    """
+    Compute the CIDv0 that IPFS assigns to a file, without uploading it
+    Matches `ipfs add` defaults (dag-pb, sha2-256, 256 KiB chunks), which is what
+    Pinata and local nodes use for single-file uploads
+
+    Args:
+        content: File content (strings are UTF-8 encoded)
+
+    Returns:
+        CIDv0 string (Qm...)
+
+    Raises:
+        ValueError: If the content spans more than one chunk
+
+    Example:
+        >>> compute_cidv0(b"hello world\\n")
+        'QmT78zSuBmuS4z925WZfrqQ1qHaJ56DQaTfyMUF7F8ff5o'
+    """
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    if len(data) > UNIXFS_CHUNK_SIZE:
+        raise ValueError(
+            f"Content larger than {UNIXFS_CHUNK_SIZE} bytes is chunked; CID not computable here"
+        )
+
+    # UnixFS Data message: Type = File (2), Data = content, filesize = len(content)
+    unixfs = b"\x08\x02"
+    if data:
+        unixfs += b"\x12" + _varint(len(data)) + data
+    unixfs += b"\x18" + _varint(len(data))
+
+    # dag-pb PBNode with only the Data field (a single chunk has no links)
+    node = b"\x0a" + _varint(len(unixfs)) + unixfs
+
+    return base58_encode(b"\x12\x20" + hashlib.sha256(node).digest())
+
+
+def _json_text(content: bytes) -> str:
+    """Decode a JSON document, unpacking one stored with upload_json(compress=True)"""
+    if content[:2] == GZIP_MAGIC:
+        content = gzip.decompress(content)
+    return content.decode("utf-8")
+
+
+def _bytes_cache_key(cid: str) -> str:
+    """Fetch cache key for raw content, kept apart from the decoded text fetch caches"""
+    # CIDs and paths never contain ':', so this cannot collide with a text entry
+    return f"bytes:{cid}"
+
+
 class IPFSClient:
     """IPFS Client for uploading, pinning, and fetching content"""
 
@@ -180,9 +348,45 @@ class IPFSClient:
         """
         self.config = config
 
+        # One pooled session for every provider and gateway call, so repeated
+        # uploads and fetches reuse warm keep-alive connections instead of paying a
+        # TCP + TLS handshake each time. Retries cover dropped connections and
+        # rate limiting: a 429 means the request was not processed, so it is
+        # re-sent with exponential backoff (honouring Retry-After) for any method.
+        self.session = requests.Session()
+        adapter = _TimeoutHTTPAdapter(
+            timeout=config.timeout,
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=(429,),
+                allowed_methods=None,
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Fetched content by CID (plus any path), least recently used first: text
+        # from fetch under the CID, raw bodies under _bytes_cache_key(cid)
+        self._fetch_cache: "OrderedDict[str, Union[str, bytes]]" = OrderedDict()
+        self._fetch_cache_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections"""
+        self.session.close()
+
+    def __enter__(self) -> "IPFSClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     def upload(
         self,
-        content: Union[str, bytes],
+        content: Union[str, bytes, IO[bytes]],
         name: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
     ) -> IPFSUploadResult:
@@ -190,26 +394,46 @@ class IPFSClient:
         Upload content to IPFS
 
         Args:
-            content: String or bytes to upload
+            content: String, bytes or binary file object to upload. A file object is
+                handed to requests as-is: NFT.Storage streams it as the request
+                body, while the multipart providers read it in full. A 429 retry
+                rewinds a seekable file; a pipe or socket is sent once
             name: Optional filename
             metadata: Optional metadata
 
         Returns:
             Upload result with CID and URLs
         """
+        # Encoded once here; the provider helpers only ever see bytes or a file object
+        body = content.encode("utf-8") if isinstance(content, str) else content
+
         if self.config.provider == "pinata":
-            return self._upload_to_pinata(content, name, metadata)
+            result = self._upload_to_pinata(body, name, metadata)
         elif self.config.provider == "nftstorage":
-            return self._upload_to_nft_storage(content, name)
+            result = self._upload_to_nft_storage(body, name)
         elif self.config.provider == "web3storage":
-            return self._upload_to_web3_storage(content, name)
+            result = self._upload_to_web3_storage(body, name)
         elif self.config.provider == "ipfs":
-            return self._upload_to_local_ipfs(content, name)
+            result = self._upload_to_local_ipfs(body, name)
         else:
             raise ValueError(f"Unsupported IPFS provider: {self.config.provider}")
 
+        # The CID names exactly these bytes, so a fetch right after the upload can
+        # be answered locally instead of waiting on a gateway
+        if isinstance(content, str):
+            self._put_cached(result.cid, content)
+        if isinstance(body, bytes):
+            self._put_cached(_bytes_cache_key(result.cid), body)
+
+        return result
+
     def upload_json(
-        self, data: Any, name: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None
+        self,
+        data: Any,
+        name: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        compress: bool = False,
+        indent: Optional[int] = 2,
     ) -> IPFSUploadResult:
         """
         Upload JSON data to IPFS
@@ -218,13 +442,66 @@ class IPFSClient:
             data: Python object to stringify and upload
             name: Optional filename
             metadata: Optional metadata
+            compress: Store the JSON gzip-compressed (typically 3-5x smaller).
+                fetch_json, fetch_json_racing and fetch_json_many unpack it
+                transparently and fetch_bytes returns the gzip bytes; fetch and
+                fetch_racing are text-only and cannot read it. Other readers get
+                gzip bytes too, so leave this off for agent registration files
+                that third parties resolve from tokenURI
+            indent: Spaces per indentation level. None writes compact JSON with no
+                whitespace, which is smaller but gets a different CID than the
+                indented form of the same data
 
         Returns:
             Upload result
         """
-        content = json.dumps(data, indent=2)
-        filename = name or "data.json"
-        return self.upload(content, filename, metadata)
+        # Encoded with the json module rather than orjson so the bytes, and the CID,
+        # are the same whichever optional packages are installed
+        if indent is None:
+            content = json.dumps(data, separators=(",", ":"))
+        else:
+            content = json.dumps(data, indent=indent)
+        if not compress:
+            result = self.upload(content, name or "data.json", metadata)
+        else:
+            # mtime=0 keeps the gzip header, and therefore the CID, deterministic
+            body = gzip.compress(content.encode("utf-8"), compresslevel=6, mtime=0)
+            result = self.upload(
+                body, name or "data.json.gz", {**(metadata or {}), "contentEncoding": "gzip"}
+            )
+        return result
+
+    def upload_directory(
+        self,
+        files: Dict[str, Union[str, bytes]],
+        name: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> IPFSUploadResult:
+        """
+        Upload several files as one IPFS directory in a single request
+        Each file is then addressable as ipfs://<cid>/<filename>
+
+        Args:
+            files: Mapping of filename to string or bytes content
+            name: Optional directory name
+            metadata: Optional metadata (Pinata only)
+
+        Returns:
+            Upload result for the directory
+        """
+        if not files:
+            raise ValueError("upload_directory requires at least one file")
+
+        if self.config.provider == "pinata":
+            return self._upload_directory_to_pinata(files, name, metadata)
+        elif self.config.provider == "nftstorage":
+            return self._upload_directory_to_nft_storage(files)
+        elif self.config.provider == "web3storage":
+            return self._upload_directory_to_web3_storage(files)
+        elif self.config.provider == "ipfs":
+            return self._upload_directory_to_local_ipfs(files)
+        else:
+            raise ValueError(f"Unsupported IPFS provider: {self.config.provider}")
 
     def pin(self, cid: str, name: Optional[str] = None) -> None:
         """
@@ -243,7 +520,9 @@ class IPFSClient:
 
     def fetch(self, cid_or_uri: str) -> str:
         """
-        Fetch content from IPFS
+        Fetch text content from IPFS
+        The body is decoded as text, so bytes that are not valid in its encoding
+        are replaced; use fetch_bytes for binary or gzip-compressed content
 
         Args:
             cid_or_uri: CID or ipfs:// URI
@@ -251,17 +530,112 @@ class IPFSClient:
         Returns:
             Content as string
         """
-        cid = cid_or_uri.replace("ipfs://", "")
+        cid = _strip_ipfs_scheme(cid_or_uri)
+        cached = self._get_cached(cid)
+        if isinstance(cached, str):
+            return cached
+
         url = f"{self.config.gateway_url}{cid}"
 
-        response = requests.get(url)
+        response = self.session.get(url)
         response.raise_for_status()
 
-        return response.text
+        content = response.text
+        self._put_cached(cid, content)
+        return content
+
+    def fetch_bytes(self, cid_or_uri: str) -> bytes:
+        """
+        Fetch content from IPFS exactly as stored
+
+        Args:
+            cid_or_uri: CID or ipfs:// URI
+
+        Returns:
+            Raw content bytes
+        """
+        cid = _strip_ipfs_scheme(cid_or_uri)
+        cached = self._get_cached(_bytes_cache_key(cid))
+        if isinstance(cached, bytes):
+            return cached
+
+        response = self.session.get(f"{self.config.gateway_url}{cid}")
+        response.raise_for_status()
+
+        self._put_cached(_bytes_cache_key(cid), response.content)
+        return response.content
+
+    def fetch_racing(
+        self,
+        cid_or_uri: str,
+        gateways: Optional[List[str]] = None,
+        timeout: float = 5.0,
+        verify: bool = True,
+    ) -> str:
+        """
+        Fetch text content from several gateways at once and return the first success
+        Like fetch, the body is decoded as text. Slow or failing gateways no longer stall the fetch; the remaining requests
+        are abandoned once one gateway answers. With verify, when the content can
+        be re-hashed locally (a bare single-chunk CIDv0 file), a response that
+        doesn't match the CID is discarded and the next gateway's answer is used
+
+        Args:
+            cid_or_uri: CID or ipfs:// URI
+            gateways: Gateway URLs to race (defaults to the configured gateway
+                followed by PUBLIC_GATEWAYS)
+            timeout: Per-gateway request timeout in seconds
+            verify: Check responses against the CID where possible (pass False for
+                directory CIDs, whose gateway response is a listing page)
+
+        Returns:
+            Content as string
+
+        Raises:
+            requests.RequestException: If every gateway failed and the last one
+                failed with a network or HTTP error (the message lists every failure)
+            ValueError: If gateways is empty, or every gateway failed and the last
+                one returned mismatching content
+        """
+        cid = _strip_ipfs_scheme(cid_or_uri)
+        cached = self._get_cached(cid)
+        if isinstance(cached, str):
+            return cached
+
+        content = self._race_gateways(cid, gateways, timeout, verify).text
+        self._put_cached(cid, content)
+        return content
+
+    def fetch_json_racing(
+        self,
+        cid_or_uri: str,
+        gateways: Optional[List[str]] = None,
+        timeout: float = 3.0,
+        verify: bool = True,
+    ) -> Any:
+        """
+        Fetch JSON content by racing several gateways (see fetch_racing)
+
+        Args:
+            cid_or_uri: CID or ipfs:// URI
+            gateways: Gateway URLs to race (defaults to the configured gateway
+                followed by PUBLIC_GATEWAYS)
+            timeout: Per-gateway request timeout in seconds
+            verify: Check responses against the CID where possible
+
+        Returns:
+            Parsed JSON object
+        """
+        cid = _strip_ipfs_scheme(cid_or_uri)
+        content = self._get_cached(_bytes_cache_key(cid))
+        if not isinstance(content, bytes):
+            content = self._race_gateways(cid, gateways, timeout, verify).content
+            self._put_cached(_bytes_cache_key(cid), content)
+        return json_loads(_json_text(content))
 
     def fetch_json(self, cid_or_uri: str) -> Any:
         """
         Fetch JSON content from IPFS
+        Documents stored with upload_json(compress=True) are unpacked first
 
         Args:
             cid_or_uri: CID or ipfs:// URI
@@ -269,8 +643,38 @@ class IPFSClient:
         Returns:
             Parsed JSON object
         """
-        content = self.fetch(cid_or_uri)
-        return json.loads(content)
+        return json_loads(_json_text(self.fetch_bytes(cid_or_uri)))
+
+    def fetch_many(self, cids_or_uris: List[str], max_workers: int = 8) -> List[str]:
+        """
+        Fetch several CIDs concurrently from the configured gateway
+        The requests share the session's connection pool (16 connections per host),
+        so up to that many run over reused keep-alive connections
+
+        Args:
+            cids_or_uris: CIDs or ipfs:// URIs
+            max_workers: Maximum number of fetches in flight
+
+        Returns:
+            Contents as strings, in the same order as cids_or_uris
+
+        Raises:
+            requests.RequestException: If any fetch failed
+        """
+        return self._fetch_concurrently(self.fetch, cids_or_uris, max_workers)
+
+    def fetch_json_many(self, cids_or_uris: List[str], max_workers: int = 8) -> List[Any]:
+        """
+        Fetch and parse several JSON documents concurrently (see fetch_many)
+
+        Args:
+            cids_or_uris: CIDs or ipfs:// URIs
+            max_workers: Maximum number of fetches in flight
+
+        Returns:
+            Parsed JSON objects, in the same order as cids_or_uris
+        """
+        return self._fetch_concurrently(self.fetch_json, cids_or_uris, max_workers)
 
     def get_gateway_url(self, cid: str) -> str:
         """
@@ -284,35 +688,125 @@ class IPFSClient:
         """
         return f"{self.config.gateway_url}{cid}"
 
+    def clear_fetch_cache(self) -> None:
+        """Drop all cached fetch results"""
+        with self._fetch_cache_lock:
+            self._fetch_cache.clear()
+
     # Private methods for different providers
 
+    def _get_cached(self, cid: str) -> Optional[Union[str, bytes]]:
+        """Look up previously fetched content"""
+        with self._fetch_cache_lock:
+            content = self._fetch_cache.get(cid)
+            if content is not None:
+                self._fetch_cache.move_to_end(cid)
+            return content
+
+    def _put_cached(self, cid: str, content: Union[str, bytes]) -> None:
+        """Remember fetched content, evicting the least recently used entry"""
+        if self.config.fetch_cache_size <= 0:
+            return
+        with self._fetch_cache_lock:
+            self._fetch_cache[cid] = content
+            self._fetch_cache.move_to_end(cid)
+            if len(self._fetch_cache) > self.config.fetch_cache_size:
+                self._fetch_cache.popitem(last=False)
+
+    def _fetch_concurrently(
+        self, fetch: Callable[[str], Any], cids_or_uris: List[str], max_workers: int
+    ) -> List[Any]:
+        """Run a fetch method over several CIDs on a thread pool, keeping input order"""
+        if len(cids_or_uris) < 2:
+            return [fetch(cid_or_uri) for cid_or_uri in cids_or_uris]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(cids_or_uris))) as executor:
+            return list(executor.map(fetch, cids_or_uris))
+
+    def _race_gateways(
+        self, cid: str, gateways: Optional[List[str]], timeout: float, verify: bool
+    ) -> requests.Response:
+        """Return the first successful (and, with verify, matching) gateway response"""
+        if gateways is None:
+            gateways = list(dict.fromkeys([self.config.gateway_url] + PUBLIC_GATEWAYS))
+        if not gateways:
+            raise ValueError("At least one gateway is required")
+
+        executor = ThreadPoolExecutor(max_workers=len(gateways))
+        futures = [
+            executor.submit(self._fetch_from_gateway, gateway, cid, timeout, verify)
+            for gateway in gateways
+        ]
+        try:
+            errors: List[Exception] = []
+            for future in as_completed(futures):
+                try:
+                    return future.result()
+                except (requests.RequestException, ValueError) as e:
+                    errors.append(e)
+            # Re-raise the last failure with the others in its message, keeping its
+            # type so callers can still tell network errors from mismatches
+            summary = "; ".join(str(e) for e in errors)
+            last = errors[-1]
+            if isinstance(last, requests.RequestException):
+                raise requests.RequestException(
+                    f"Every gateway failed for {cid}: {summary}"
+                ) from last
+            raise ValueError(f"Every gateway failed for {cid}: {summary}") from last
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _fetch_from_gateway(
+        self, gateway_url: str, cid: str, timeout: float, verify: bool = False
+    ) -> requests.Response:
+        """Fetch content from a single gateway"""
+        response = self.session.get(f"{gateway_url}{cid}", timeout=timeout)
+        response.raise_for_status()
+
+        # Content addressing lets us check the gateway didn't serve something else
+        if (
+            verify
+            and cid.startswith("Qm")
+            and "/" not in cid
+            and len(response.content) <= UNIXFS_CHUNK_SIZE
+            and compute_cidv0(response.content) != cid
+        ):
+            raise ValueError(f"Gateway {gateway_url} returned content that does not match {cid}")
+
+        return response
+
     def _upload_to_pinata(
-        self, content: Union[str, bytes], name: Optional[str], metadata: Optional[Dict[str, Any]]
+        self, body: Union[bytes, IO[bytes]], name: Optional[str], metadata: Optional[Dict[str, Any]]
     ) -> IPFSUploadResult:
         """Upload to Pinata"""
         if not self.config.api_key or not self.config.api_secret:
             raise ValueError("Pinata requires both api_key and api_secret")
 
-        # Convert content to bytes if needed
-        if isinstance(content, str):
-            content_bytes = content.encode("utf-8")
-        else:
-            content_bytes = content
+        if (
+            self.config.skip_pinned_uploads
+            and isinstance(body, bytes)
+            and len(body) <= UNIXFS_CHUNK_SIZE
+        ):
+            existing = self._find_pinata_pin(compute_cidv0(body))
+            if existing is not None:
+                return existing
 
         # Create multipart form data
-        files = {"file": (name or "file", content_bytes)}
+        files = {"file": (name or "file", body)}
 
         # Add metadata if provided
-        data = {}
+        data: Dict[str, str] = {}
         if metadata or name:
-            pinata_metadata = {}
+            pinata_metadata: Dict[str, Any] = {}
             if name:
                 pinata_metadata["name"] = name
             if metadata:
                 pinata_metadata["keyvalues"] = metadata
             data["pinataMetadata"] = json.dumps(pinata_metadata)
 
-        response = requests.post(
+        response = self.session.post(
             "https://api.pinata.cloud/pinning/pinFileToIPFS",
             files=files,
             data=data,
@@ -323,7 +817,7 @@ class IPFSClient:
         )
         response.raise_for_status()
 
-        result = response.json()
+        result = json_loads(response.content)
         cid = result["IpfsHash"]
 
         return IPFSUploadResult(
@@ -333,78 +827,89 @@ class IPFSClient:
             size=result.get("PinSize"),
         )
 
+    def _find_pinata_pin(self, cid: str) -> Optional[IPFSUploadResult]:
+        """Return the existing Pinata pin for a CID, or None if it isn't pinned"""
+        if not self.config.api_key or not self.config.api_secret:
+            raise ValueError("Pinata requires both api_key and api_secret")
+
+        response = self.session.get(
+            "https://api.pinata.cloud/data/pinList",
+            params={"hashContains": cid, "status": "pinned", "pageLimit": "1"},
+            headers={
+                "pinata_api_key": self.config.api_key,
+                "pinata_secret_api_key": self.config.api_secret,
+            },
+        )
+        response.raise_for_status()
+
+        rows = [
+            row
+            for row in json_loads(response.content).get("rows", [])
+            if row.get("ipfs_pin_hash") == cid
+        ]
+        if not rows:
+            return None
+
+        return IPFSUploadResult(
+            cid=cid,
+            uri=f"ipfs://{cid}",
+            url=self.get_gateway_url(cid),
+            size=rows[0].get("size"),
+        )
+
     def _upload_to_nft_storage(
-        self, content: Union[str, bytes], name: Optional[str]
+        self, body: Union[bytes, IO[bytes]], name: Optional[str]
     ) -> IPFSUploadResult:
         """Upload to NFT.Storage"""
         if not self.config.api_key:
             raise ValueError("NFT.Storage requires an API key")
 
-        # Convert content to bytes if needed
-        if isinstance(content, str):
-            content_bytes = content.encode("utf-8")
+        url = "https://api.nft.storage/upload"
+        headers = {"Authorization": f"Bearer {self.config.api_key}"}
+        if isinstance(body, bytes) or body.seekable():
+            # urllib3 seeks a file body back to its start before a 429 retry
+            response = self.session.post(url, data=body, headers=headers)
         else:
-            content_bytes = content
-
-        response = requests.post(
-            "https://api.nft.storage/upload",
-            data=content_bytes,
-            headers={"Authorization": f"Bearer {self.config.api_key}"},
-        )
+            # A pipe or socket cannot be rewound, so it is sent once without retries
+            response = requests.post(url, data=body, headers=headers, timeout=self.config.timeout)
         response.raise_for_status()
 
-        result = response.json()
+        result = json_loads(response.content)
         cid = result["value"]["cid"]
 
-        return IPFSUploadResult(
-            cid=cid, uri=f"ipfs://{cid}", url=self.get_gateway_url(cid)
-        )
+        return IPFSUploadResult(cid=cid, uri=f"ipfs://{cid}", url=self.get_gateway_url(cid))
 
     def _upload_to_web3_storage(
-        self, content: Union[str, bytes], name: Optional[str]
+        self, body: Union[bytes, IO[bytes]], name: Optional[str]
     ) -> IPFSUploadResult:
         """Upload to Web3.Storage"""
         if not self.config.api_key:
             raise ValueError("Web3.Storage requires an API key")
 
-        # Convert content to bytes if needed
-        if isinstance(content, str):
-            content_bytes = content.encode("utf-8")
-        else:
-            content_bytes = content
-
-        files = {"file": (name or "file", content_bytes)}
+        files = {"file": (name or "file", body)}
 
-        response = requests.post(
+        response = self.session.post(
             "https://api.web3.storage/upload",
             files=files,
             headers={"Authorization": f"Bearer {self.config.api_key}"},
         )
         response.raise_for_status()
 
-        result = response.json()
+        result = json_loads(response.content)
         cid = result["cid"]
 
-        return IPFSUploadResult(
-            cid=cid, uri=f"ipfs://{cid}", url=self.get_gateway_url(cid)
-        )
+        return IPFSUploadResult(cid=cid, uri=f"ipfs://{cid}", url=self.get_gateway_url(cid))
 
     def _upload_to_local_ipfs(
-        self, content: Union[str, bytes], name: Optional[str]
+        self, body: Union[bytes, IO[bytes]], name: Optional[str]
     ) -> IPFSUploadResult:
         """Upload to local IPFS node"""
-        # Convert content to bytes if needed
-        if isinstance(content, str):
-            content_bytes = content.encode("utf-8")
-        else:
-            content_bytes = content
-
-        files = {"file": (name or "file", content_bytes)}
+        files = {"file": (name or "file", body)}
 
-        response = requests.post(f"{self.config.node_url}/api/v0/add", files=files)
+        response = self.session.post(f"{self.config.node_url}/api/v0/add", files=files)
         response.raise_for_status()
 
-        result = response.json()
+        result = json_loads(response.content)
         cid = result["Hash"]
 
         return IPFSUploadResult(
@@ -414,16 +919,130 @@ class IPFSClient:
             size=result.get("Size"),
         )
 
+    def _directory_parts(
+        self, files: Dict[str, Union[str, bytes]], prefix: str = ""
+    ) -> List[tuple]:
+        """Build one multipart "file" field per directory entry"""
+        return [
+            (
+                "file",
+                (
+                    f"{prefix}{filename}",
+                    content.encode("utf-8") if isinstance(content, str) else content,
+                ),
+            )
+            for filename, content in files.items()
+        ]
+
+    def _upload_directory_to_pinata(
+        self,
+        files: Dict[str, Union[str, bytes]],
+        name: Optional[str],
+        metadata: Optional[Dict[str, Any]],
+    ) -> IPFSUploadResult:
+        """Upload a directory to Pinata"""
+        if not self.config.api_key or not self.config.api_secret:
+            raise ValueError("Pinata requires both api_key and api_secret")
+
+        # Pinata builds the directory from a shared leading path component
+        directory = name or "files"
+
+        pinata_metadata: Dict[str, Any] = {"name": directory}
+        if metadata:
+            pinata_metadata["keyvalues"] = metadata
+
+        response = self.session.post(
+            "https://api.pinata.cloud/pinning/pinFileToIPFS",
+            files=self._directory_parts(files, prefix=f"{directory}/"),
+            data={"pinataMetadata": json.dumps(pinata_metadata)},
+            headers={
+                "pinata_api_key": self.config.api_key,
+                "pinata_secret_api_key": self.config.api_secret,
+            },
+        )
+        response.raise_for_status()
+
+        result = json_loads(response.content)
+        cid = result["IpfsHash"]
+
+        return IPFSUploadResult(
+            cid=cid,
+            uri=f"ipfs://{cid}",
+            url=self.get_gateway_url(cid),
+            size=result.get("PinSize"),
+        )
+
+    def _upload_directory_to_nft_storage(
+        self, files: Dict[str, Union[str, bytes]]
+    ) -> IPFSUploadResult:
+        """Upload a directory to NFT.Storage"""
+        if not self.config.api_key:
+            raise ValueError("NFT.Storage requires an API key")
+
+        response = self.session.post(
+            "https://api.nft.storage/upload",
+            files=self._directory_parts(files),
+            headers={"Authorization": f"Bearer {self.config.api_key}"},
+        )
+        response.raise_for_status()
+
+        result = json_loads(response.content)
+        cid = result["value"]["cid"]
+
+        return IPFSUploadResult(cid=cid, uri=f"ipfs://{cid}", url=self.get_gateway_url(cid))
+
+    def _upload_directory_to_web3_storage(
+        self, files: Dict[str, Union[str, bytes]]
+    ) -> IPFSUploadResult:
+        """Upload a directory to Web3.Storage"""
+        if not self.config.api_key:
+            raise ValueError("Web3.Storage requires an API key")
+
+        response = self.session.post(
+            "https://api.web3.storage/upload",
+            files=self._directory_parts(files),
+            headers={"Authorization": f"Bearer {self.config.api_key}"},
+        )
+        response.raise_for_status()
+
+        result = json_loads(response.content)
+        cid = result["cid"]
+
+        return IPFSUploadResult(cid=cid, uri=f"ipfs://{cid}", url=self.get_gateway_url(cid))
+
+    def _upload_directory_to_local_ipfs(
+        self, files: Dict[str, Union[str, bytes]]
+    ) -> IPFSUploadResult:
+        """Upload a directory to local IPFS node"""
+        response = self.session.post(
+            f"{self.config.node_url}/api/v0/add?wrap-with-directory=true",
+            files=self._directory_parts(files),
+        )
+        response.raise_for_status()
+
+        # The node streams one JSON object per added entry; the wrapping
+        # directory is the one with an empty name
+        entries = [json_loads(line) for line in response.text.splitlines() if line.strip()]
+        directory = next(entry for entry in entries if entry.get("Name") == "")
+        cid = directory["Hash"]
+
+        return IPFSUploadResult(
+            cid=cid,
+            uri=f"ipfs://{cid}",
+            url=self.get_gateway_url(cid),
+            size=int(directory["Size"]) if directory.get("Size") else None,
+        )
+
     def _pin_on_pinata(self, cid: str, name: Optional[str]) -> None:
         """Pin on Pinata"""
         if not self.config.api_key or not self.config.api_secret:
             raise ValueError("Pinata requires both api_key and api_secret")
 
-        payload = {"hashToPin": cid}
+        payload: Dict[str, Any] = {"hashToPin": cid}
         if name:
             payload["pinataMetadata"] = {"name": name}
 
-        response = requests.post(
+        response = self.session.post(
             "https://api.pinata.cloud/pinning/pinByHash",
             json=payload,
             headers={
@@ -436,7 +1055,7 @@ class IPFSClient:
 
     def _pin_on_local_ipfs(self, cid: str) -> None:
         """Pin on local IPFS node"""
-        response = requests.post(f"{self.config.node_url}/api/v0/pin/add?arg={cid}")
+        response = self.session.post(f"{self.config.node_url}/api/v0/pin/add?arg={cid}")
         response.raise_for_status()
 
 
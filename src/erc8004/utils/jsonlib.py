@@ -0,0 +1,29 @@
+"""
+JSON decoding with an optional fast backend
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """
+    Parse a JSON document
+    Uses orjson when it is installed (pip install erc-8004-py[fast]) and the
+    standard library otherwise. Encoding is left to the json module so that
+    uploaded bytes, and therefore their CIDs, do not depend on what is installed
+
+    Args:
+        data: JSON text or UTF-8 encoded bytes
+
+    Returns:
+        Parsed JSON object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
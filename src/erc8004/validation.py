@@ -3,14 +3,11 @@ Validation Client for ERC-8004
 Handles validation requests and responses
 """
 
-import json
-import os
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
-from web3 import Web3
-
-from .adapters.base import BlockchainAdapter
+from .adapters.base import BlockchainAdapter, ContractCall
 from .types import ValidationStatus
+from .utils.abi import load_abi, to_bytes32
 
 
 class ValidationClient:
@@ -27,12 +24,8 @@ class ValidationClient:
         self.adapter = adapter
         self.contract_address = contract_address
 
-        # Load ABI
-        abi_path = os.path.join(
-            os.path.dirname(__file__), "abis", "ValidationRegistry.json"
-        )
-        with open(abi_path, "r") as f:
-            self.abi = json.load(f)
+        # Load ABI (shared across clients)
+        self.abi = load_abi("ValidationRegistry")
 
     def validation_request(
         self,
@@ -40,6 +33,7 @@ class ValidationClient:
         agent_id: int,
         request_uri: str,
         request_hash: str,
+        wait: bool = True,
     ) -> Dict[str, str]:
         """
         Request validation from a validator
@@ -52,16 +46,22 @@ class ValidationClient:
             agent_id: Agent ID (MANDATORY)
             request_uri: URI to validation request content (MANDATORY)
             request_hash: Hash of content at requestUri (MANDATORY, bytes32)
+            wait: Wait for the transaction to be mined. With False it is only
+                broadcast; confirm it with adapter.wait_for_transaction(txHash)
+                before the validator responds
 
         Returns:
             Dictionary with txHash and requestHash
         """
-        result = self.adapter.send(
-            self.contract_address,
-            self.abi,
-            "validationRequest",
-            [validator_address, agent_id, request_uri, request_hash],
-        )
+        args = [validator_address, agent_id, request_uri, request_hash]
+
+        if not wait:
+            tx_hash = self.adapter.broadcast(
+                self.contract_address, self.abi, "validationRequest", args
+            )
+            return {"txHash": tx_hash, "requestHash": request_hash}
+
+        result = self.adapter.send(self.contract_address, self.abi, "validationRequest", args)
 
         return {"txHash": result["txHash"], "requestHash": request_hash}
 
@@ -70,8 +70,9 @@ class ValidationClient:
         request_hash: str,
         response: int,
         response_uri: Optional[str] = None,
-        response_hash: Optional[str] = None,
+        response_hash: Optional[Union[str, bytes]] = None,
         tag: Optional[str] = None,
+        wait: bool = True,
     ) -> Dict[str, str]:
         """
         Provide a validation response
@@ -83,30 +84,34 @@ class ValidationClient:
             request_hash: Request hash (MANDATORY, bytes32)
             response: Response value 0-100 (MANDATORY)
             response_uri: URI to response content (OPTIONAL)
-            response_hash: Hash of response content (OPTIONAL, bytes32)
+            response_hash: Hash of response content (OPTIONAL, bytes32, as hex or bytes)
             tag: Tag for categorization (OPTIONAL, now a string not bytes32)
+            wait: Wait for the transaction to be mined. With False it is only
+                broadcast; confirm it with adapter.wait_for_transaction(txHash)
 
         Returns:
             Dictionary with txHash
         """
-        # Validate response is 0-100
-        if response < 0 or response > 100:
-            raise ValueError("Response MUST be between 0 and 100")
+        # Validate response is an integer 0-100; bools and floats would otherwise only
+        # fail later inside ABI encoding
+        if isinstance(response, bool) or not isinstance(response, int) or not 0 <= response <= 100:
+            raise ValueError("Response MUST be an integer between 0 and 100")
 
         # Convert optional parameters to proper format
         response_uri_str = response_uri or ""
-        response_hash_bytes = (
-            bytes.fromhex(response_hash[2:]) if response_hash else bytes(32)
-        )
+        response_hash_bytes = to_bytes32(response_hash)
         # NEW: Tag is now a string, pass it directly
         tag_str = tag or ""
 
-        result = self.adapter.send(
-            self.contract_address,
-            self.abi,
-            "validationResponse",
-            [request_hash, response, response_uri_str, response_hash_bytes, tag_str],
-        )
+        args = [request_hash, response, response_uri_str, response_hash_bytes, tag_str]
+
+        if not wait:
+            tx_hash = self.adapter.broadcast(
+                self.contract_address, self.abi, "validationResponse", args
+            )
+            return {"txHash": tx_hash}
+
+        result = self.adapter.send(self.contract_address, self.abi, "validationResponse", args)
 
         return {"txHash": result["txHash"]}
 
@@ -118,9 +123,10 @@ class ValidationClient:
         Returns:
             Identity registry address
         """
-        return self.adapter.call(
+        identity_registry: str = self.adapter.call(
             self.contract_address, self.abi, "getIdentityRegistry", []
         )
+        return identity_registry
 
     def get_validation_status(self, request_hash: str) -> ValidationStatus:
         """
@@ -137,36 +143,37 @@ class ValidationClient:
             self.contract_address, self.abi, "getValidationStatus", [request_hash]
         )
 
-        # Backward compatibility: handle both old (5 values) and new (6 values) contracts
-        # Old: (validatorAddress, agentId, response, tag, lastUpdate)
-        # New: (validatorAddress, agentId, response, responseHash, tag, lastUpdate)
-        if len(result) == 5:
-            # Old contract without responseHash
-            return {
-                "validatorAddress": result[0],
-                "agentId": int(result[1]),
-                "response": int(result[2]),
-                "responseHash": "0x" + "00" * 32,  # Empty bytes32
-                "tag": result[3],  # NEW: Now a string, no hex conversion needed
-                "lastUpdate": int(result[4]),
-            }
-        else:
-            # New contract with responseHash
-            return {
-                "validatorAddress": result[0],
-                "agentId": int(result[1]),
-                "response": int(result[2]),
-                "responseHash": result[3].hex() if isinstance(result[3], bytes) else result[3],
-                "tag": result[4],  # NEW: Now a string, no hex conversion needed
-                "lastUpdate": int(result[5]),
-            }
+        return self._format_status(result)
+
+    def get_validation_statuses(self, request_hashes: List[str]) -> List[ValidationStatus]:
+        """
+        Get the validation status of several requests in one batched read
+        Uses the adapter's call_batch, so supporting adapters need a single round-trip
+
+        Args:
+            request_hashes: The request hashes (bytes32)
+
+        Returns:
+            ValidationStatus dictionaries, in the same order as request_hashes
+        """
+        if not request_hashes:
+            return []
+
+        results = self.adapter.call_batch(
+            [
+                (self.contract_address, self.abi, "getValidationStatus", [request_hash])
+                for request_hash in request_hashes
+            ]
+        )
+
+        return [self._format_status(result) for result in results]
 
     def get_summary(
         self,
         agent_id: int,
         validator_addresses: Optional[List[str]] = None,
         tag: Optional[str] = None,
-    ) -> Dict[str, any]:
+    ) -> Dict[str, Any]:
         """
         Get validation summary for an agent
         Spec: function getSummary(uint256 agentId, address[] validatorAddresses, string tag) returns (uint64 count, uint8 avgResponse)
@@ -191,7 +198,7 @@ class ValidationClient:
             [agent_id, validators, tag_str],
         )
 
-        return {"count": int(result[0]), "avgResponse": int(result[1])}
+        return self._format_summary(result)
 
     def get_agent_validations(self, agent_id: int) -> List[str]:
         """
@@ -208,7 +215,7 @@ class ValidationClient:
             self.contract_address, self.abi, "getAgentValidations", [agent_id]
         )
 
-        return [r.hex() if isinstance(r, bytes) else r for r in result]
+        return self._format_hashes(result)
 
     def get_validator_requests(self, validator_address: str) -> List[str]:
         """
@@ -225,4 +232,98 @@ class ValidationClient:
             self.contract_address, self.abi, "getValidatorRequests", [validator_address]
         )
 
-        return [r.hex() if isinstance(r, bytes) else r for r in result]
+        return self._format_hashes(result)
+
+    def get_validation_overview(
+        self,
+        agent_id: int,
+        validator_address: Optional[str] = None,
+        request_hash: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Read an agent's validation summary and request hashes in one batched read
+        Uses the adapter's call_batch, so supporting adapters need a single round-trip
+
+        Args:
+            agent_id: The agent ID
+            validator_address: OPTIONAL validator to filter the summary by and whose
+                request hashes to include
+            request_hash: OPTIONAL request whose status to include
+
+        Returns:
+            Dictionary with summary and agentValidations, plus validatorRequests when
+            validator_address is given and status when request_hash is given
+        """
+        validators = [validator_address] if validator_address is not None else []
+        calls: List[ContractCall] = [
+            (self.contract_address, self.abi, "getSummary", [agent_id, validators, ""]),
+            (self.contract_address, self.abi, "getAgentValidations", [agent_id]),
+        ]
+        if validator_address is not None:
+            calls.append(
+                (self.contract_address, self.abi, "getValidatorRequests", [validator_address])
+            )
+        if request_hash is not None:
+            calls.append((self.contract_address, self.abi, "getValidationStatus", [request_hash]))
+
+        results = self.adapter.call_batch(calls)
+
+        overview = {
+            "summary": self._format_summary(results[0]),
+            "agentValidations": self._format_hashes(results[1]),
+        }
+        next_result = 2
+        if validator_address is not None:
+            overview["validatorRequests"] = self._format_hashes(results[next_result])
+            next_result += 1
+        if request_hash is not None:
+            overview["status"] = self._format_status(results[next_result])
+
+        return overview
+
+    def _format_summary(self, result: List) -> Dict[str, Any]:
+        """
+        Helper: Convert a getSummary result to a dictionary
+        """
+        return {"count": int(result[0]), "avgResponse": int(result[1])}
+
+    def _format_hashes(self, result: List) -> List[str]:
+        """
+        Helper: Convert a list of bytes32 request hashes to hex strings
+        """
+        # An adapter decodes every element of the array the same way, so the type
+        # is checked once instead of per hash
+        if not result:
+            return []
+        if isinstance(result[0], bytes):
+            return list(map(bytes.hex, result))
+        return list(result)
+
+    def _format_status(self, result: List) -> ValidationStatus:
+        """
+        Helper: Convert a getValidationStatus result to a ValidationStatus
+        """
+        # Backward compatibility: handle both old (5 values) and new (6 values) contracts
+        # Old: (validatorAddress, agentId, response, tag, lastUpdate)
+        # New: (validatorAddress, agentId, response, responseHash, tag, lastUpdate)
+        if len(result) == 5:
+            # Old contract without responseHash
+            return {
+                "validatorAddress": result[0],
+                "agentId": int(result[1]),
+                "response": int(result[2]),
+                "responseHash": "0x" + "00" * 32,  # Empty bytes32
+                "tag": result[3],  # NEW: Now a string, no hex conversion needed
+                "lastUpdate": int(result[4]),
+            }
+        else:
+            # New contract with responseHash
+            return {
+                "validatorAddress": result[0],
+                "agentId": int(result[1]),
+                "response": int(result[2]),
+                "responseHash": result[3].hex() if isinstance(result[3], bytes) else result[3],
+                "tag": result[4],  # NEW: Now a string, no hex conversion needed
+                "lastUpdate": int(result[5]),
+            }
+
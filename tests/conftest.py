@@ -0,0 +1,67 @@
+"""
+Shared fixtures for the offline test suite
+Runs against eth-tester (pip install "web3[tester]"), no node or network needed
+"""
+
+from typing import Any, List
+
+import pytest
+from web3 import EthereumTesterProvider, Web3
+
+from erc8004 import ContractAddresses, ERC8004Client, Web3Adapter
+
+
+def stub_registry_code() -> bytes:
+    """
+    Init code for a stub registry: every call bumps a counter in slot 0 and emits
+    Registered(counter, "", msg.sender), then returns 96 zero bytes
+    """
+    topic = Web3.keccak(text="Registered(uint256,string,address)")
+    runtime = (
+        # SLOAD 0, add 1, SSTORE 0 (keeping a copy), MSTORE the 0x20 string offset
+        bytes.fromhex("600054600101806000556020600052")
+        # CALLER, SWAP1, PUSH32 topic, LOG3 over memory[0:0x40], RETURN memory[0:0x60]
+        + bytes.fromhex("33907f")
+        + topic
+        + bytes.fromhex("60406000a360606000f3")
+    )
+    size = len(runtime)
+    return bytes([0x60, size, 0x60, 0x0C, 0x60, 0x00, 0x39, 0x60, size, 0x60, 0x00, 0xF3]) + runtime
+
+
+@pytest.fixture
+def w3() -> Web3:
+    return Web3(EthereumTesterProvider())
+
+
+@pytest.fixture
+def private_keys(w3: Web3) -> List[str]:
+    backend: Any = w3.provider.ethereum_tester.backend  # type: ignore[attr-defined]
+    return [key.to_hex() for key in backend.account_keys]
+
+
+@pytest.fixture
+def registry_address(w3: Web3) -> str:
+    # Deployed from the last account so private_keys[0] starts at nonce 0
+    tx_hash = w3.eth.send_transaction(
+        {"from": w3.eth.accounts[-1], "data": stub_registry_code(), "gas": 500000}
+    )
+    address = w3.eth.wait_for_transaction_receipt(tx_hash)["contractAddress"]
+    assert address is not None
+    return address
+
+
+@pytest.fixture
+def adapter(w3: Web3, private_keys: List[str]) -> Web3Adapter:
+    return Web3Adapter(w3, private_key=private_keys[0])
+
+
+@pytest.fixture
+def client(w3: Web3, adapter: Web3Adapter, registry_address: str) -> ERC8004Client:
+    addresses: ContractAddresses = {
+        "identityRegistry": registry_address,
+        "reputationRegistry": registry_address,
+        "validationRegistry": registry_address,
+        "chainId": w3.eth.chain_id,
+    }
+    return ERC8004Client(adapter=adapter, addresses=addresses)
@@ -0,0 +1,48 @@
+"""Tests for IdentityClient against the stub registry"""
+
+from typing import Any, List
+
+import pytest
+
+from erc8004 import ERC8004Client
+
+
+def test_register_many_returns_agents_in_submission_order(client: ERC8004Client) -> None:
+    results = client.identity.register_many(3)
+
+    assert [result["agentId"] for result in results] == [1, 2, 3]
+    hashes = [result["txHash"] for result in results]
+    assert len(set(hashes)) == 3
+
+
+def test_register_many_keeps_results_around_a_failure(
+    client: ERC8004Client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    adapter: Any = client.adapter
+    get_gas_limit = adapter._get_gas_limit
+    sign_and_send = adapter._sign_and_send
+    estimates: List[int] = []
+    sends: List[int] = []
+
+    def low_gas_second(function: Any) -> int:
+        # Too little gas for the second transaction, so it is mined and reverts
+        estimates.append(1)
+        return 21100 if len(estimates) == 2 else int(get_gas_limit(function))
+
+    def fail_fourth(*args: Any) -> Any:
+        sends.append(1)
+        if len(sends) == 4:
+            raise ValueError("node rejected the transaction")
+        return sign_and_send(*args)
+
+    monkeypatch.setattr(adapter, "_get_gas_limit", low_gas_second)
+    monkeypatch.setattr(adapter, "_sign_and_send", fail_fourth)
+
+    results = client.identity.register_many(5)
+
+    assert len(results) == 5
+    assert [result.get("agentId") for result in results] == [1, None, 2, None, 3]
+    # The reverted transaction was sent, so its hash is kept; the rejected one never was
+    assert results[1]["txHash"] and "reverted" in str(results[1]["error"])
+    assert results[3]["txHash"] is None
+    assert isinstance(results[3]["error"], ValueError)
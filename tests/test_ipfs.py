@@ -0,0 +1,316 @@
+"""Tests for the IPFS client with its HTTP session replaced by an in-memory gateway"""
+
+import gzip
+import hashlib
+import json
+import time
+from typing import Any, Dict, List, Optional, Set
+
+import pytest
+import requests
+
+from erc8004 import IPFSClient, IPFSClientConfig
+from erc8004.utils.ipfs import (
+    GZIP_MAGIC,
+    base58_decode,
+    base58_encode,
+    cid_to_bytes32,
+    compute_cidv0,
+)
+
+GATEWAY_URL = "https://gateway.example/ipfs/"
+
+
+def make_response(url: str, status_code: int, body: bytes) -> requests.Response:
+    """Build a requests.Response as the session would return it"""
+    response = requests.Response()
+    response.url = url
+    response.status_code = status_code
+    response._content = body
+    return response
+
+
+class FakeSession:
+    """
+    Serves content by CID for GETs and stores local-node uploads under their CIDv0
+    Every request URL is recorded so tests can tell cache hits from fetches. Gateways
+    (URL prefixes) can be made to fail with a status code, answer late, or serve
+    tampered content
+    """
+
+    def __init__(self) -> None:
+        self.content: Dict[str, bytes] = {}
+        self.requests: List[str] = []
+        self.failing: Dict[str, int] = {}
+        self.delays: Dict[str, float] = {}
+        self.tampered: Set[str] = set()
+
+    def get(self, url: str, timeout: Optional[float] = None, **kwargs: Any) -> requests.Response:
+        self.requests.append(url)
+        gateway, cid = url.rsplit("/", 1)
+        gateway += "/"
+        time.sleep(self.delays.get(gateway, 0))
+        if gateway in self.failing:
+            return make_response(url, self.failing[gateway], b"gateway error")
+        if gateway in self.tampered:
+            return make_response(url, 200, b"tampered")
+        body = self.content.get(cid)
+        if body is None:
+            return make_response(url, 404, b"not found")
+        return make_response(url, 200, body)
+
+    def post(self, url: str, files: Any = None, **kwargs: Any) -> requests.Response:
+        self.requests.append(url)
+        _, body = files["file"]
+        cid = compute_cidv0(body)
+        self.content[cid] = body
+        return make_response(url, 200, json.dumps({"Hash": cid, "Size": len(body)}).encode())
+
+    def add(self, body: bytes) -> str:
+        """Store content directly, as if another client had uploaded it"""
+        cid = compute_cidv0(body)
+        self.content[cid] = body
+        return cid
+
+
+@pytest.fixture
+def session() -> FakeSession:
+    return FakeSession()
+
+
+def make_client(
+    session: FakeSession, monkeypatch: pytest.MonkeyPatch, fetch_cache_size: int = 256
+) -> IPFSClient:
+    client = IPFSClient(
+        IPFSClientConfig(
+            provider="ipfs", gateway_url=GATEWAY_URL, fetch_cache_size=fetch_cache_size
+        )
+    )
+    monkeypatch.setattr(client.session, "get", session.get)
+    monkeypatch.setattr(client.session, "post", session.post)
+    return client
+
+
+@pytest.fixture
+def client(session: FakeSession, monkeypatch: pytest.MonkeyPatch) -> IPFSClient:
+    return make_client(session, monkeypatch)
+
+
+def test_compute_cidv0_matches_ipfs_add() -> None:
+    assert compute_cidv0(b"hello world\n") == "QmT78zSuBmuS4z925WZfrqQ1qHaJ56DQaTfyMUF7F8ff5o"
+    assert compute_cidv0("hello world\n") == "QmT78zSuBmuS4z925WZfrqQ1qHaJ56DQaTfyMUF7F8ff5o"
+    assert compute_cidv0(b"") == "QmbFMke1KXqnYyBBWxB74N4c5SBnJMVAiMNRcGu6x1AwQH"
+
+
+def test_compute_cidv0_rejects_chunked_content() -> None:
+    with pytest.raises(ValueError):
+        compute_cidv0(b"x" * (262144 + 1))
+
+
+@pytest.mark.parametrize(
+    "data, encoded",
+    [
+        (b"", ""),
+        (b"\x00", "1"),
+        (b"\x00\x00\x01", "112"),
+        (b"Hello World!", "2NEpo7TZRRrLZSi2U"),
+        (bytes(range(256)), base58_encode(bytes(range(256)))),
+    ],
+)
+def test_base58_round_trip(data: bytes, encoded: str) -> None:
+    assert base58_encode(data) == encoded
+    assert base58_decode(encoded) == data
+
+
+def test_base58_decode_rejects_invalid_characters() -> None:
+    with pytest.raises(ValueError, match="Invalid base58 character: 0"):
+        base58_decode("Qm0")
+    with pytest.raises(ValueError):
+        base58_decode("Qmé")
+
+
+def test_cid_to_bytes32_returns_the_sha256_digest() -> None:
+    digest = hashlib.sha256(b"some node").digest()
+    cid = base58_encode(b"\x12\x20" + digest)
+
+    assert cid_to_bytes32(cid) == "0x" + digest.hex()
+    with pytest.raises(ValueError):
+        cid_to_bytes32("bafybeigdyrzt5sfp7udm7hu76uh7y26nf3efuylqabf3oclgtqy55fbzdi")
+
+
+def test_fetch_after_upload_is_served_from_the_cache(
+    client: IPFSClient, session: FakeSession
+) -> None:
+    result = client.upload("hello world\n")
+    session.requests.clear()
+
+    assert result.cid == "QmT78zSuBmuS4z925WZfrqQ1qHaJ56DQaTfyMUF7F8ff5o"
+    assert client.fetch(result.cid) == "hello world\n"
+    assert client.fetch_bytes(result.uri) == b"hello world\n"
+    assert session.requests == []
+
+
+def test_fetch_cache_evicts_the_least_recently_used_cid(
+    session: FakeSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = make_client(session, monkeypatch, fetch_cache_size=2)
+    first, second, third = (session.add(body) for body in (b"first", b"second", b"third"))
+
+    client.fetch(first)
+    client.fetch(second)
+    client.fetch(first)
+    client.fetch(third)
+    session.requests.clear()
+
+    # second was used least recently, so fetching third evicted it
+    assert client.fetch(first) == "first"
+    assert session.requests == []
+    assert client.fetch(second) == "second"
+    assert session.requests == [GATEWAY_URL + second]
+
+
+def test_fetch_cache_size_zero_disables_the_cache(
+    session: FakeSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = make_client(session, monkeypatch, fetch_cache_size=0)
+    cid = session.add(b"content")
+
+    client.fetch(cid)
+    client.fetch(cid)
+
+    assert len(session.requests) == 2
+
+
+def test_clear_fetch_cache_forces_a_refetch(client: IPFSClient, session: FakeSession) -> None:
+    cid = session.add(b"content")
+    client.fetch(cid)
+    client.clear_fetch_cache()
+    client.fetch(cid)
+
+    assert len(session.requests) == 2
+
+
+def test_fetch_raises_for_missing_content(client: IPFSClient) -> None:
+    with pytest.raises(requests.HTTPError):
+        client.fetch(compute_cidv0(b"never uploaded"))
+
+
+def test_compressed_json_round_trip(client: IPFSClient, session: FakeSession) -> None:
+    data = {"name": "agent", "endpoints": [{"name": "A2A", "endpoint": "https://a.example"}] * 20}
+
+    result = client.upload_json(data, compress=True)
+    client.clear_fetch_cache()
+
+    stored = session.content[result.cid]
+    assert stored[:2] == GZIP_MAGIC
+    assert result.cid == compute_cidv0(stored)
+    assert json.loads(gzip.decompress(stored)) == data
+    # fetch_json unpacks, fetch_bytes returns exactly what was stored
+    assert client.fetch_json(result.uri) == data
+    assert client.fetch_bytes(result.cid) == stored
+
+
+def test_fetch_returns_text_not_json_for_compressed_content(
+    client: IPFSClient, session: FakeSession
+) -> None:
+    data = {"name": "agent"}
+    result = client.upload_json(data, compress=True)
+    client.clear_fetch_cache()
+
+    text = client.fetch(result.cid)
+
+    # fetch only decodes text; the gzip bytes are readable only through the JSON helpers
+    assert isinstance(text, str)
+    with pytest.raises(ValueError):
+        json.loads(text)
+    assert client.fetch_json(result.cid) == data
+
+
+def test_uncompressed_json_round_trip(client: IPFSClient, session: FakeSession) -> None:
+    data = {"name": "agent", "description": "déjà vu"}
+
+    result = client.upload_json(data)
+    client.clear_fetch_cache()
+
+    assert session.content[result.cid] == json.dumps(data, indent=2).encode("utf-8")
+    assert client.fetch_json(result.cid) == data
+    assert client.fetch(result.cid) == json.dumps(data, indent=2)
+
+
+SLOW = "https://slow.example/ipfs/"
+BROKEN = "https://broken.example/ipfs/"
+TAMPERED = "https://tampered.example/ipfs/"
+GOOD = "https://good.example/ipfs/"
+
+
+def test_fetch_racing_returns_the_first_good_gateway(
+    client: IPFSClient, session: FakeSession
+) -> None:
+    cid = session.add(b"raced content")
+    session.delays[SLOW] = 1.0
+    session.failing[BROKEN] = 500
+    session.tampered.add(TAMPERED)
+
+    started = time.monotonic()
+    content = client.fetch_racing(cid, gateways=[SLOW, BROKEN, TAMPERED, GOOD])
+
+    assert content == "raced content"
+    # The slow gateway is abandoned rather than waited for
+    assert time.monotonic() - started < 0.5
+    session.requests.clear()
+    assert client.fetch_racing(cid, gateways=[GOOD]) == "raced content"
+    assert session.requests == []
+
+
+def test_fetch_racing_without_verify_accepts_any_response(
+    client: IPFSClient, session: FakeSession
+) -> None:
+    cid = session.add(b"raced content")
+    session.tampered.add(TAMPERED)
+
+    assert client.fetch_racing(cid, gateways=[TAMPERED], verify=False) == "tampered"
+
+
+def test_fetch_racing_raises_value_error_when_every_response_mismatches(
+    client: IPFSClient, session: FakeSession
+) -> None:
+    cid = session.add(b"raced content")
+    session.tampered.add(TAMPERED)
+
+    with pytest.raises(ValueError, match="does not match"):
+        client.fetch_racing(cid, gateways=[TAMPERED])
+
+
+def test_fetch_racing_raises_request_exception_listing_every_failure(
+    client: IPFSClient, session: FakeSession
+) -> None:
+    cid = session.add(b"raced content")
+    session.failing[BROKEN] = 500
+    session.failing[GOOD] = 429
+
+    with pytest.raises(requests.RequestException) as excinfo:
+        client.fetch_racing(cid, gateways=[BROKEN, GOOD])
+
+    message = str(excinfo.value)
+    assert message.startswith(f"Every gateway failed for {cid}")
+    assert "500" in message and "429" in message
+
+
+def test_fetch_racing_requires_a_gateway(client: IPFSClient, session: FakeSession) -> None:
+    cid = session.add(b"raced content")
+
+    with pytest.raises(ValueError, match="At least one gateway is required"):
+        client.fetch_racing(cid, gateways=[])
+    with pytest.raises(ValueError, match="At least one gateway is required"):
+        client.fetch_json_racing(cid, gateways=[])
+    assert session.requests == []
+
+
+def test_fetch_json_racing_unpacks_compressed_json(
+    client: IPFSClient, session: FakeSession
+) -> None:
+    data = {"name": "agent"}
+    cid = session.add(gzip.compress(json.dumps(data).encode("utf-8"), mtime=0))
+    session.failing[BROKEN] = 503
+
+    assert client.fetch_json_racing(cid, gateways=[BROKEN, GOOD]) == data
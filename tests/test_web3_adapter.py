@@ -0,0 +1,199 @@
+"""Tests for Web3Adapter against eth-tester"""
+
+from typing import Any, Dict, List
+
+import pytest
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.exceptions import BadFunctionCallOutput
+
+from erc8004 import Web3Adapter
+
+REGISTER_ABI: List[Dict[str, Any]] = [
+    {
+        "type": "function",
+        "name": "register",
+        "inputs": [],
+        "outputs": [{"name": "agentId", "type": "uint256"}],
+        "stateMutability": "nonpayable",
+    }
+]
+
+
+def count_nonce_reads(w3: Web3, monkeypatch: pytest.MonkeyPatch) -> List[Any]:
+    """Record every get_transaction_count call made through w3"""
+    calls: List[Any] = []
+    get_transaction_count = w3.eth.get_transaction_count
+
+    def counted(*args: Any) -> Any:
+        calls.append(args)
+        return get_transaction_count(*args)
+
+    monkeypatch.setattr(w3.eth, "get_transaction_count", counted)
+    return calls
+
+
+def test_broadcasts_in_a_burst_count_the_nonce_locally(
+    w3: Web3, adapter: Web3Adapter, registry_address: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    nonce_reads = count_nonce_reads(w3, monkeypatch)
+
+    tx_hashes = [
+        adapter.broadcast(registry_address, REGISTER_ABI, "register", []) for _ in range(5)
+    ]
+    nonces = [w3.eth.get_transaction(HexBytes(tx_hash))["nonce"] for tx_hash in tx_hashes]
+
+    assert nonces == [0, 1, 2, 3, 4]
+    # Only the first broadcast asks the node
+    assert len(nonce_reads) == 1
+    for tx_hash in tx_hashes:
+        assert adapter.wait_for_transaction(tx_hash)["receipt"]["status"] == 1
+
+
+def test_nonce_resyncs_after_nonce_ttl(
+    w3: Web3, private_keys: List[str], registry_address: str
+) -> None:
+    first = Web3Adapter(w3, private_key=private_keys[0], nonce_ttl=0)
+    other = Web3Adapter(w3, private_key=private_keys[0])
+
+    first.send(registry_address, REGISTER_ABI, "register", [])
+    # Another signer for the same key moves the nonce on
+    other.send(registry_address, REGISTER_ABI, "register", [])
+    other.send(registry_address, REGISTER_ABI, "register", [])
+
+    assert first.next_nonce() == 3
+
+
+def test_reset_nonce_rereads_within_nonce_ttl(
+    w3: Web3, private_keys: List[str], registry_address: str
+) -> None:
+    first = Web3Adapter(w3, private_key=private_keys[0], nonce_ttl=60)
+    other = Web3Adapter(w3, private_key=private_keys[0])
+
+    first.send(registry_address, REGISTER_ABI, "register", [])
+    other.send(registry_address, REGISTER_ABI, "register", [])
+    first.reset_nonce()
+
+    result = first.send(registry_address, REGISTER_ABI, "register", [])
+    assert w3.eth.get_transaction(result["txHash"])["nonce"] == 2
+
+
+def test_failed_broadcast_releases_its_nonce(
+    w3: Web3, adapter: Web3Adapter, registry_address: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sign_and_send = adapter._sign_and_send
+    attempts: List[int] = []
+
+    def fail_first(*args: Any) -> Any:
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ValueError("node rejected the transaction")
+        return sign_and_send(*args)
+
+    monkeypatch.setattr(adapter, "_sign_and_send", fail_first)
+
+    with pytest.raises(ValueError):
+        adapter.send(registry_address, REGISTER_ABI, "register", [])
+    result = adapter.send(registry_address, REGISTER_ABI, "register", [])
+
+    assert w3.eth.get_transaction(result["txHash"])["nonce"] == 0
+
+
+# The stub registry runs the same code for any selector and returns the words
+# (0x20, 0, 0), so view functions can be decoded as several different outputs
+VIEW_ABI: List[Dict[str, Any]] = [
+    {
+        "type": "function",
+        "name": "getWords",
+        "inputs": [{"name": "agentId", "type": "uint256"}, {"name": "owner", "type": "address"}],
+        "outputs": [
+            {"name": "count", "type": "uint256"},
+            {"name": "owner", "type": "address"},
+            {"name": "hash", "type": "bytes32"},
+        ],
+        "stateMutability": "view",
+    },
+    {
+        "type": "function",
+        "name": "getUri",
+        "inputs": [{"name": "agentId", "type": "uint256"}],
+        "outputs": [{"name": "uri", "type": "string"}],
+        "stateMutability": "view",
+    },
+    {
+        "type": "function",
+        "name": "getClients",
+        "inputs": [{"name": "agentId", "type": "uint256"}],
+        "outputs": [{"name": "clients", "type": "address[]"}],
+        "stateMutability": "view",
+    },
+]
+
+VIEW_CALLS: List[Any] = [
+    ("getWords", [7, "0x" + "11" * 20]),
+    ("getUri", [7]),
+    ("getClients", [7]),
+]
+
+
+def test_raw_codec_reads_match_web3_contract_calls(
+    w3: Web3, adapter: Web3Adapter, registry_address: str
+) -> None:
+    contract = w3.eth.contract(address=Web3.to_checksum_address(registry_address), abi=VIEW_ABI)
+
+    for function_name, args in VIEW_CALLS:
+        # Every view function here has a precomputed codec, so call skips web3's encoder
+        assert function_name in adapter._get_read_codecs(VIEW_ABI)
+        expected = getattr(contract.functions, function_name)(*args).call()
+        assert adapter.call(registry_address, VIEW_ABI, function_name, args) == expected
+
+    assert adapter.call(registry_address, VIEW_ABI, "getWords", [7, "0x" + "11" * 20]) == [
+        32,
+        "0x0000000000000000000000000000000000000000",
+        b"\x00" * 32,
+    ]
+
+
+def test_call_batch_decodes_raw_reads_in_call_order(
+    adapter: Web3Adapter, registry_address: str
+) -> None:
+    calls: List[Any] = [
+        (registry_address, VIEW_ABI, function_name, args) for function_name, args in VIEW_CALLS
+    ]
+
+    results = adapter.call_batch(calls)
+
+    assert results == [adapter.call(*call) for call in calls]
+
+
+def test_raw_read_without_code_raises_bad_function_call_output(adapter: Web3Adapter) -> None:
+    with pytest.raises(BadFunctionCallOutput):
+        adapter.call("0x" + "22" * 20, VIEW_ABI, "getUri", [1])
+
+
+def test_gas_is_estimated_for_each_transaction(
+    w3: Web3, private_keys: List[str], registry_address: str
+) -> None:
+    adapter = Web3Adapter(w3, private_key=private_keys[0], gas_limit=None)
+
+    first = adapter.send(registry_address, REGISTER_ABI, "register", [])
+    second = adapter.send(registry_address, REGISTER_ABI, "register", [])
+
+    # The first call sets the counter slot from zero, so it needs more gas than the second
+    first_gas = w3.eth.get_transaction(HexBytes(first["txHash"]))["gas"]
+    second_gas = w3.eth.get_transaction(HexBytes(second["txHash"]))["gas"]
+    assert first_gas > second_gas
+
+
+def test_reverted_transaction_raises(
+    w3: Web3, private_keys: List[str], registry_address: str
+) -> None:
+    # Enough gas to be accepted, too little to run the call
+    adapter = Web3Adapter(w3, private_key=private_keys[0], gas_limit=21100)
+
+    with pytest.raises(ValueError, match="reverted"):
+        adapter.send(registry_address, REGISTER_ABI, "register", [])
+
+    tx_hash = adapter.broadcast(registry_address, REGISTER_ABI, "register", [])
+    with pytest.raises(ValueError, match="reverted"):
+        adapter.wait_for_transaction(tx_hash)